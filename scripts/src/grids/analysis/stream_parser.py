@@ -216,10 +216,13 @@ def parse_stream(stream_path: str | Path) -> ParsedStream:
     stream_path = Path(stream_path)
     result = ParsedStream()
 
-    pending_starts: dict[str, dict] = {}  # keyed by "domain/agent"
+    pending_starts: dict[str, dict] = {}  # keyed by "domain/agent@pos"
     current_tick = 0
     # LLM calls that happen before the first tick event belong to tick 1
     first_tick_seen = False
+    # Newer logs stamp events with monotonic "ts_ms" relative to the
+    # run_start "start_wall_ts"; normalize to epoch-seconds "ts".
+    start_wall_ts = 0.0
 
     with open(stream_path, "r", encoding="utf-8") as f:
         for line in f:
@@ -233,6 +236,11 @@ def parse_stream(stream_path: str | Path) -> ParsedStream:
 
             etype = entry.get("type", "")
 
+            if etype == "run_start" and "start_wall_ts" in entry:
+                start_wall_ts = entry["start_wall_ts"]
+            if "ts_ms" in entry:
+                entry["ts"] = start_wall_ts + entry["ts_ms"] / 1000
+
             if etype == "run_start":
                 result.run_start = entry
                 result.brief = entry.get("brief", "")
@@ -276,12 +284,17 @@ def parse_stream(stream_path: str | Path) -> ParsedStream:
                 current_tick = te.tick
 
             elif etype == "llm_start":
-                key = f"{entry.get('domain', '')}/{entry.get('agent', '')}"
+                key = f"{entry.get('domain', '')}/{entry.get('agent', '')}@{entry.get('pos', '')}"
                 pending_starts[key] = entry
 
             elif etype == "llm_end":
                 key = f"{entry.get('domain', '')}/{entry.get('agent', '')}"
-                start = pending_starts.pop(key, {})
+                if "pos" in entry:
+                    start = pending_starts.pop(f"{key}@{entry['pos']}", {})
+                else:
+                    # Older logs: llm_end has no pos; calls never overlapped
+                    match = next((k for k in pending_starts if k.startswith(f"{key}@")), None)
+                    start = pending_starts.pop(match, {}) if match else {}
                 response = entry.get("response", "")
                 tokens = entry.get("token_count", 0)
                 result.total_tokens += tokens
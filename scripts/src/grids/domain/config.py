@@ -5,6 +5,12 @@ from pathlib import Path
 import yaml
 from pydantic import BaseModel, Field
 
+# LibYAML's C loader when PyYAML was built with it; same semantics as safe_load
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 
 class PDFSource(BaseModel):
     path: str
@@ -72,5 +78,5 @@ def load_domain(path: str | Path) -> DomainConfig:
     """Load and validate a domain config from a YAML file."""
     path = Path(path)
     with open(path, "r", encoding="utf-8") as f:
-        raw = yaml.safe_load(f)
+        raw = yaml.load(f, Loader=YamlLoader)
     return DomainConfig(**raw)
@@ -15,10 +15,13 @@ Reinertsen principles implemented:
 
 from __future__ import annotations
 
+import sys
 import time
+from bisect import insort
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from typing import Any, Callable
 
 from grids.orchestration.rules import AgentState, RuleTable, Signal, Action, RuleEntry
 
@@ -28,10 +31,13 @@ class Neighborhood(str, Enum):
     MOORE = "moore"              # 8 neighbors: N, NE, E, SE, S, SW, W, NW
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WorkFragment:
     """A local unit of work in a cell's inbox. Smaller than a WorkOrder --
-    this is what propagates between cells."""
+    this is what propagates between cells.
+
+    Frozen: derive per-target copies with dataclasses.replace(). Copies may
+    share one tags mapping, so tags are read-only too."""
     id: str
     kind: str           # "brief_chunk", "research", "concept", "layout", "critique", "code", "artifact"
     content: Any        # the actual payload (text, dict, SVG, etc.)
@@ -40,7 +46,7 @@ class WorkFragment:
     job_size: float = 1.0
     iteration: int = 0
     created_at: float = field(default_factory=time.time)
-    tags: dict[str, str] = field(default_factory=dict)
+    tags: Mapping[str, str] = field(default_factory=dict)
 
     @property
     def wsjf(self) -> float:
@@ -49,6 +55,10 @@ class WorkFragment:
         return self.cost_of_delay / self.job_size
 
 
+def _neg_wsjf(fragment: WorkFragment) -> float:
+    return -fragment.wsjf
+
+
 @dataclass
 class CellOutput:
     """Snapshot of a cell's last emitted output, visible to neighbors."""
@@ -58,9 +68,12 @@ class CellOutput:
     state: AgentState = AgentState.IDLE
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentCell:
-    """A single cell in the agent grid. Follows NKS: local state + local rules."""
+    """A single cell in the agent grid. Follows NKS: local state + local rules.
+
+    Slotted: cells are created per placement and their fields are read on
+    every tick, so no per-instance __dict__."""
 
     position: tuple[int, int]
     domain: str                    # "design", "editorial", etc.
@@ -101,8 +114,16 @@ class AgentCell:
     ticks_active: int = 0
     items_processed: int = 0
     llm_calls: int = 0
+    cache_hits: int = 0  # invoke_fn calls answered from a response cache
     transitions: list[dict] = field(default_factory=list)
 
+    def __post_init__(self):
+        # Names often come from domain YAML; interned, they compare by
+        # identity against the literals used in routing and rule checks.
+        self.domain = sys.intern(self.domain)
+        self.agent_type = sys.intern(self.agent_type)
+        self.role = sys.intern(self.role)
+
     @property
     def has_work(self) -> bool:
         return len(self.inbox) > 0
@@ -115,8 +136,12 @@ class AgentCell:
         """Accept a work fragment into inbox if capacity allows."""
         if self.at_capacity:
             return False
-        self.inbox.append(fragment)
-        self.inbox.sort(key=lambda f: f.wsjf, reverse=True)
+        # Inbox is kept sorted by WSJF, highest first; insert after equal
+        # priorities so arrival order is kept among them.
+        if self.inbox:
+            insort(self.inbox, fragment, key=_neg_wsjf)
+        else:
+            self.inbox.append(fragment)
         return True
 
     def peek_inbox(self) -> WorkFragment | None:
@@ -143,13 +168,14 @@ class AgentCell:
         n_waiting = 0
         n_active_output = 0
         for n in neighbor_states:
-            if n.state == AgentState.WORKING:
+            state = n.state
+            if state is AgentState.WORKING:
                 n_working += 1
-            elif n.state == AgentState.CRITIQUING:
+            elif state is AgentState.CRITIQUING:
                 n_critiquing += 1
-            elif n.state == AgentState.IDLE:
+            elif state is AgentState.IDLE:
                 n_idle += 1
-            elif n.state == AgentState.WAITING:
+            elif state is AgentState.WAITING:
                 n_waiting += 1
             if n.content is not None and n.kind:
                 n_active_output += 1
@@ -214,14 +240,14 @@ class AgentCell:
         # Class 4 anti-quiescence: STALE detection
         # Cell has been idle too long while neighbors are actively producing.
         # This prevents premature quiescence -- the key Class 4 behavior.
-        if (self.state == AgentState.IDLE
+        if (self.state is AgentState.IDLE
                 and self.ticks_idle_consecutive >= self.stale_threshold
                 and (n_working >= 2 or n_active_output >= 2)):
             self.ticks_idle_consecutive = 0  # reset after firing
             return Signal.STALE
 
         # Totalistic: idle cell with many active neighbors should try to help
-        if (self.state == AgentState.IDLE
+        if (self.state is AgentState.IDLE
                 and self.ticks_active > 0
                 and n_working >= 3):
             return Signal.NEIGHBOR_IDLE
@@ -272,6 +298,7 @@ class AgentCell:
             "ticks_active": self.ticks_active,
             "items_processed": self.items_processed,
             "llm_calls": self.llm_calls,
+            "cache_hits": self.cache_hits,
             "last_output_kind": self.output.kind,
             "last_output_tick": self.output.tick,
             "stuck_ticks": self.stuck_ticks,
@@ -297,18 +324,28 @@ class AgentGrid:
         self.cells: dict[tuple[int, int], AgentCell] = {}
         self.tick_count: int = 0
         self._pending_propagations: list[tuple[tuple[int, int], WorkFragment]] = []
+        # Topology and role caches, cleared whenever a cell is placed
+        self._neighbor_cache: dict[tuple[int, int], tuple[tuple[int, int], ...]] = {}
+        self._receiver_cache: dict[tuple[tuple[int, int], str], tuple[tuple[int, int], ...]] = {}
+        self._by_role: dict[str, tuple[AgentCell, ...]] | None = None
 
     def place(self, cell: AgentCell):
         """Place a cell at its position on the grid."""
         if not (0 <= cell.position[0] < self.width and 0 <= cell.position[1] < self.height):
             raise ValueError(f"Position {cell.position} out of bounds for {self.width}x{self.height} grid")
         self.cells[cell.position] = cell
+        self._neighbor_cache.clear()
+        self._receiver_cache.clear()
+        self._by_role = None
 
     def get(self, pos: tuple[int, int]) -> AgentCell | None:
         return self.cells.get(pos)
 
-    def neighbor_positions(self, pos: tuple[int, int]) -> list[tuple[int, int]]:
+    def neighbor_positions(self, pos: tuple[int, int]) -> tuple[tuple[int, int], ...]:
         """Get valid neighbor positions for a cell. Wrapping optional (toroidal grid)."""
+        cached = self._neighbor_cache.get(pos)
+        if cached is not None:
+            return cached
         x, y = pos
         if self.neighborhood == Neighborhood.VON_NEUMANN:
             offsets = [(0, -1), (0, 1), (-1, 0), (1, 0)]
@@ -324,7 +361,29 @@ class AgentGrid:
             if 0 <= nx < self.width and 0 <= ny < self.height:
                 if (nx, ny) in self.cells:
                     neighbors.append((nx, ny))
-        return neighbors
+        cached = self._neighbor_cache[pos] = tuple(neighbors)
+        return cached
+
+    def receiving_neighbors(
+        self,
+        pos: tuple[int, int],
+        kind: str,
+        should_receive: Callable[[AgentCell, str, AgentCell], bool],
+    ) -> tuple[tuple[int, int], ...]:
+        """Neighbor positions of the cell at pos that accept output of this kind.
+
+        should_receive(neighbor, kind, source) is evaluated once per
+        (pos, kind) and cached until the next place(); callers must always
+        pass the same predicate."""
+        key = (pos, kind)
+        cached = self._receiver_cache.get(key)
+        if cached is None:
+            source = self.cells[pos]
+            cached = self._receiver_cache[key] = tuple(
+                npos for npos in self.neighbor_positions(pos)
+                if should_receive(self.cells[npos], kind, source)
+            )
+        return cached
 
     def neighbors(self, pos: tuple[int, int]) -> list[AgentCell]:
         """Get actual neighbor cells."""
@@ -339,6 +398,15 @@ class AgentGrid:
         NKS: outputs propagate after all cells have computed."""
         self._pending_propagations.append((target_pos, fragment))
 
+    def schedule_propagations(self, pending: list[tuple[tuple[int, int], WorkFragment]]):
+        """schedule_propagation for several (target_pos, fragment) pairs, in order."""
+        self._pending_propagations.extend(pending)
+
+    def take_propagations(self) -> list[tuple[tuple[int, int], WorkFragment]]:
+        """Remove and return the pending propagations, in order."""
+        pending, self._pending_propagations = self._pending_propagations, []
+        return pending
+
     def flush_propagations(self):
         """Deliver all pending work fragments to their target cells.
         Called at the end of a tick."""
@@ -394,7 +462,13 @@ class AgentGrid:
         return [c for c in self.cells.values() if c.domain == domain]
 
     def cells_by_role(self, role: str) -> list[AgentCell]:
-        return [c for c in self.cells.values() if c.role == role]
+        by_role = self._by_role
+        if by_role is None:
+            index: dict[str, list[AgentCell]] = {}
+            for c in self.cells.values():
+                index.setdefault(c.role, []).append(c)
+            by_role = self._by_role = {r: tuple(cs) for r, cs in index.items()}
+        return list(by_role.get(role, ()))
 
     def cells_by_state(self, state: AgentState) -> list[AgentCell]:
         return [c for c in self.cells.values() if c.state == state]
@@ -402,7 +476,7 @@ class AgentGrid:
     def is_quiescent(self) -> bool:
         """Check if all cells are idle with empty inboxes. Grid has settled."""
         return all(
-            c.state == AgentState.IDLE and not c.has_work
+            c.state is AgentState.IDLE and not c.has_work
             for c in self.cells.values()
         )
 
@@ -435,7 +509,7 @@ class AgentGrid:
                 cost_of_delay=fragment.cost_of_delay,
                 job_size=fragment.job_size,
                 iteration=fragment.iteration,
-                tags=dict(fragment.tags),
+                tags=fragment.tags,
             ))
 
     def snapshot(self) -> dict:
@@ -11,7 +11,7 @@ and rule tables are the "rules". Together they produce emergence.
 from __future__ import annotations
 
 import json
-from typing import Any
+from typing import Any, Sequence
 
 from grids.orchestration.grid import AgentCell, CellOutput, WorkFragment
 from grids.orchestration.rules import Action
@@ -313,8 +313,9 @@ def _invoke_master(
     if action == Action.PROCESS:
         # Decompose brief into work specification
         messages = [
-            SystemMessage(content=_master_system_prompt(cell, context)),
+            SystemMessage(content=_master_system_prompt(cell)),
             HumanMessage(content=(
+                f"Domain knowledge:\n{context}\n\n"
                 f"Decompose this into a structured work specification with concrete, "
                 f"buildable components. Your domain is: {cell.domain}.\n\n"
                 f"Input:\n{_content_str(work.content)}\n\n"
@@ -329,8 +330,9 @@ def _invoke_master(
         # Validate an artifact from a neighbor
         neighbor_context = _neighbor_summary(neighbors)
         messages = [
-            SystemMessage(content=_master_system_prompt(cell, context)),
+            SystemMessage(content=_master_system_prompt(cell)),
             HumanMessage(content=(
+                f"Domain knowledge:\n{context}\n\n"
                 f"Validate this work product from your domain perspective ({cell.domain}).\n\n"
                 f"Work product:\n{_content_str(work.content)}\n\n"
                 f"Neighbor context:\n{neighbor_context}\n\n"
@@ -456,10 +458,10 @@ def _invoke_sub_agent(
             SystemMessage(content=(
                 f"You are the {cell.agent_type} specialist in the {cell.domain} domain. "
                 f"Your strictness level is {cell.strictness} (higher = stricter).\n\n"
-                f"Domain knowledge:\n{context}\n\n"
                 f"Evaluate ONLY your narrow specialty. Score 0-100."
             )),
             HumanMessage(content=(
+                f"Domain knowledge:\n{context}\n\n"
                 f"Review this from your {cell.agent_type} perspective:\n\n"
                 f"{_content_str(work.content)}\n\n"
                 f"Neighbor context:\n{neighbor_context}\n\n"
@@ -471,10 +473,10 @@ def _invoke_sub_agent(
         messages = [
             SystemMessage(content=(
                 f"You are the {cell.agent_type} specialist in the {cell.domain} domain. "
-                f"You contribute your specific expertise to collaborative work.\n\n"
-                f"Domain knowledge:\n{context}"
+                f"You contribute your specific expertise to collaborative work."
             )),
             HumanMessage(content=(
+                f"Domain knowledge:\n{context}\n\n"
                 f"Apply your {cell.agent_type} expertise to this:\n\n"
                 f"{_content_str(work.content)}\n\n"
                 f"Neighbor context:\n{neighbor_context}\n\n"
@@ -702,10 +704,10 @@ def _invoke_consultant_review(
             f"- Domain principles that are violated or missing\n"
             f"- Opportunities to better express domain values in the implementation\n"
             f"- Specific, actionable patches grounded in your domain knowledge\n\n"
-            f"Domain knowledge:\n{context}\n\n"
             f"Domain-specific context:\n{domain_context if domain_context else '(use knowledge base)'}"
         )),
         HumanMessage(content=(
+            f"Domain knowledge:\n{context}\n\n"
             f"Review this execution artifact from your {cell.domain} expertise:\n\n"
             f"{_content_str(work.content)}\n\n"
             f"Neighbor context:\n{neighbor_context}\n\n"
@@ -1061,7 +1063,6 @@ def _invoke_execution(
             f"assets described in the specification. NOT the assets themselves. NOT a description "
             f"of a program. WORKING CODE."
             f"{ui_catalog_section}"
-            f"{current_practices}"
         ),
         "tester": _build_tester_prompt(work, project_type, framework),
         "runner": (
@@ -1074,7 +1075,6 @@ def _invoke_execution(
             f"metro.config.js, tsconfig.json, and a valid package.json with all dependencies.\n"
             f"Output JSON: {{\"files\": [{{\"path\": \"...\", \"content\": \"...\"}}], "
             f"\"build_command\": \"...\", \"run_command\": \"...\"}}"
-            f"{current_practices}"
         ),
     }
 
@@ -1088,6 +1088,7 @@ def _invoke_execution(
             f"Specification:\n{_content_str(work.content)}\n\n"
             f"Iteration: {work.iteration}\n"
             f"Neighbor context:\n{neighbor_context}\n\n"
+            f"{current_practices}"
             f"Produce the working software."
         )),
     ]
@@ -1194,10 +1195,10 @@ def _invoke_gap_analysis(
             SystemMessage(content=(
                 f"You are a research agent for {cell.domain}. "
                 f"Analyze what your neighbors have produced and identify knowledge gaps. "
-                f"Generate new research queries for areas not yet covered.\n\n"
-                f"Domain knowledge:\n{context}"
+                f"Generate new research queries for areas not yet covered."
             )),
             HumanMessage(content=(
+                f"Domain knowledge:\n{context}\n\n"
                 f"Neighbor outputs so far:\n{neighbor_context}\n\n"
                 f"What knowledge areas are missing? What hasn't been researched yet? "
                 f"Output 3-5 new research findings focused on gaps."
@@ -1222,10 +1223,10 @@ def _invoke_gap_analysis(
             SystemMessage(content=(
                 f"You are the {cell.agent_type} agent in {cell.domain}. "
                 f"Re-evaluate the current state of work from your perspective. "
-                f"What aspects of the brief haven't been adequately addressed?\n\n"
-                f"Domain knowledge:\n{context}"
+                f"What aspects of the brief haven't been adequately addressed?"
             )),
             HumanMessage(content=(
+                f"Domain knowledge:\n{context}\n\n"
                 f"Neighbor outputs:\n{neighbor_context}\n\n"
                 f"Identify gaps in the current work from your {cell.agent_type} perspective. "
                 f"Output a structured analysis with specific recommendations."
@@ -1240,8 +1241,13 @@ def _invoke_gap_analysis(
 
 def _get_cell_context(cell: AgentCell, query: str, n: int = 3) -> str:
     """Retrieve knowledge context for a cell. LOCAL ONLY -- cell's own collections."""
+    return _collections_context(cell.knowledge_collections[:4], query, n)  # limit collections per query
+
+
+def _collections_context(collections: Sequence[str], query: str, n: int = 3) -> str:
+    """Knowledge context for query from the given collections."""
     parts = []
-    for coll in cell.knowledge_collections[:4]:  # limit collections per query
+    for coll in collections:
         try:
             hits = query_store(query, coll, n_results=n)
             for hit in hits:
@@ -1265,12 +1271,12 @@ def _neighbor_summary(neighbors: list[CellOutput], max_items: int = 4) -> str:
     return "\n".join(parts)
 
 
-def _master_system_prompt(cell: AgentCell, context: str) -> str:
+def _master_system_prompt(cell: AgentCell) -> str:
+    """Fixed per domain; retrieved knowledge goes in the human message."""
     return (
         f"You are the master agent for the {cell.domain} domain.\n"
         f"You decompose briefs into structured work, validate artifacts, "
-        f"and have veto power over sub-agent outputs.\n\n"
-        f"Domain knowledge:\n{context}"
+        f"and have veto power over sub-agent outputs."
     )
 
 
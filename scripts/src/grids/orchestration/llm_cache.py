@@ -0,0 +1,107 @@
+"""Exact-match caches for LLM calls.
+
+consolidate_analysis / consolidate_product_spec are single large LLM calls
+whose inputs (brief, project config, grid outputs) are often identical when
+a phase is re-run (e.g. `grids-run --phases 1b` against the same grid
+output). Results are keyed by a SHA-256 of those inputs plus the model name
+and stored as JSON under tmp/llm-cache/consolidate/.
+
+cached_invoke_fn wraps a per-cell invoke_fn with an in-memory cache so
+Phase 2b rework grids reuse responses for cells whose inputs are unchanged
+from the Phase 2 run (only cells downstream of the validation errors see
+different work).
+
+Bump SCHEMA_VERSION whenever consolidation prompts or output shape change.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Callable
+
+from grids.orchestration import agents
+from grids.orchestration.invoke import _collect_grid_outputs
+
+SCHEMA_VERSION = 1
+
+CACHE_DIR = Path(__file__).resolve().parents[4] / "tmp" / "llm-cache" / "consolidate"
+
+
+def consolidation_key(name: str, grid, *inputs: Any) -> str:
+    """Hash everything a consolidation call depends on."""
+    domain_outputs, _ = _collect_grid_outputs(grid)
+    material = [SCHEMA_VERSION, name, agents.DEFAULT_MODEL, domain_outputs, *inputs]
+    blob = json.dumps(material, sort_keys=True, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def cached_consolidate(
+    name: str,
+    fn: Callable[..., Any],
+    grid,
+    *args: Any,
+    cache_dir: Path = CACHE_DIR,
+) -> tuple[Any, bool]:
+    """Call fn(grid, *args) unless an identical call is cached.
+
+    Returns (result, cache_hit)."""
+    path = cache_dir / f"{consolidation_key(name, grid, *args)}.json"
+    if path.exists():
+        try:
+            return json.loads(path.read_text(encoding="utf-8")), True
+        except (OSError, json.JSONDecodeError):
+            pass
+
+    result = fn(grid, *args)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(result, default=str), encoding="utf-8")
+    except OSError:
+        pass
+    return result, False
+
+
+def invoke_key(cell, action, work, neighbors, model: str | None = None) -> str:
+    """Hash everything a per-cell invoke_fn call depends on.
+
+    model is the model invoke_fn calls; by default the one get_llm() uses."""
+    material = [
+        SCHEMA_VERSION, "invoke", model or agents.DEFAULT_MODEL,
+        cell.domain, cell.role, cell.agent_type, action.value,
+        cell.knowledge_collections, cell.strictness, cell.project_config,
+        cell.output.content,
+        [work.kind, work.content, work.tags] if work is not None else None,
+        [[n.kind, n.state.value, n.content] for n in neighbors],
+    ]
+    blob = json.dumps(material, sort_keys=True, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def cached_invoke_fn(
+    invoke_fn: Callable[..., Any],
+    cache: dict[str, Any],
+    on_hit: Callable[[Any, Any], None] | None = None,
+    model: str | None = None,
+) -> Callable[..., Any]:
+    """Wrap invoke_fn so identical calls are answered from cache.
+
+    cache is shared by the caller across the grids that should reuse
+    responses; on_hit(cell, action) is called for each cache hit. Hits are
+    counted in cell.cache_hits, which tick() keeps out of llm_calls.
+    None results are not cached."""
+
+    def invoke(cell, action, work, neighbors):
+        key = invoke_key(cell, action, work, neighbors, model)
+        if key in cache:
+            cell.cache_hits += 1
+            if on_hit is not None:
+                on_hit(cell, action)
+            return cache[key]
+        result = invoke_fn(cell, action, work, neighbors)
+        if result is not None:
+            cache[key] = result
+        return result
+
+    return invoke
@@ -97,6 +97,8 @@ class VideoRecorder:
         self.total_llm_calls = 0
         self.start_time = time.time()
         self.frame_count = 0
+        # Stream lines queued since the last frame (see queue_stream_event)
+        self._queued_events = 0
 
         # Fonts
         self.font_grid = _load_font(FONT_SIZE_GRID)
@@ -147,6 +149,19 @@ class VideoRecorder:
         color = domain_rgb(domain) if domain else TEXT_COLOR
         self.stream_lines.append(StreamEvent(text=text, color=color))
 
+    def queue_stream_event(self, text: str, domain: str = ""):
+        """Add a line to the agent stream without rendering a frame.
+
+        Queued lines show up in the next frame written, so per-token
+        callers don't block on rendering and the ffmpeg pipe."""
+        self.add_stream_event(text, domain=domain)
+        self._queued_events += 1
+
+    def flush_frames(self):
+        """Write a frame if stream lines were queued since the last one."""
+        if self._queued_events:
+            self.write_frame()
+
     def on_tick(self, result: TickResult):
         """Called after each tick. Renders a frame."""
         self.tick_count = result.tick
@@ -194,6 +209,7 @@ class VideoRecorder:
         if self._proc is None or self._proc.stdin is None:
             return
 
+        self._queued_events = 0
         img = self._render_frame()
         raw = img.tobytes()
 
@@ -20,12 +20,11 @@ Usage:
 
 from __future__ import annotations
 
-import copy
 import hashlib
 import json
 import random
 import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any
 
@@ -218,7 +217,7 @@ class RuleSearchHarness:
         """Generate a mutated variant of a rule table.
         Mutations: change action, change next_state, add rule, remove rule."""
         rt = RuleTable(name=f"{base.name}-mutant", description=base.description)
-        rt.rules = [copy.deepcopy(r) for r in base.rules]
+        rt.rules = list(base.rules)
 
         valid_actions = ROLE_ACTIONS.get(role, ALL_ACTIONS)
 
@@ -226,12 +225,12 @@ class RuleSearchHarness:
             mutation_type = random.choice(["change_action", "change_next_state", "add_rule", "remove_rule"])
 
             if mutation_type == "change_action" and rt.rules:
-                rule = random.choice(rt.rules)
-                rule.action = random.choice(valid_actions)
+                idx = random.randrange(len(rt.rules))
+                rt.rules[idx] = replace(rt.rules[idx], action=random.choice(valid_actions))
 
             elif mutation_type == "change_next_state" and rt.rules:
-                rule = random.choice(rt.rules)
-                rule.next_state = random.choice(ALL_STATES)
+                idx = random.randrange(len(rt.rules))
+                rt.rules[idx] = replace(rt.rules[idx], next_state=random.choice(ALL_STATES))
 
             elif mutation_type == "add_rule":
                 state = random.choice(ALL_STATES)
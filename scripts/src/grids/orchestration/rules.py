@@ -10,7 +10,9 @@ one god-agent with a massive system prompt.
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping
 
 
 class AgentState(str, Enum):
@@ -55,6 +57,21 @@ class RuleEntry:
     action: Action
     next_state: AgentState
     metadata: dict[str, Any] = field(default_factory=dict)
+    _serialized: dict[str, Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Entries are treated as immutable once built (rule search uses
+        # dataclasses.replace), so the serialized form is computed once.
+        self._serialized = {
+            "state": self.state.value,
+            "signal": self.signal.value,
+            "action": self.action.value,
+            "next_state": self.next_state.value,
+            "metadata": self.metadata,
+        }
+
+    def to_dict(self) -> dict:
+        return self._serialized
 
 
 @dataclass
@@ -62,12 +79,46 @@ class RuleTable:
     """A named set of rules for an agent type."""
     name: str
     description: str
-    rules: list[RuleEntry] = field(default_factory=list)
+    rules: list[RuleEntry] | tuple[RuleEntry, ...] = field(default_factory=list)
+    _index: Mapping[tuple[AgentState, Signal], RuleEntry] | None = field(
+        default=None, init=False, repr=False, compare=False,
+    )
 
     def add(self, state: AgentState, signal: Signal, action: Action, next_state: AgentState, **meta):
+        if self.finalized:
+            raise TypeError(f"Rule table '{self.name}' is finalized and cannot be extended")
         self.rules.append(RuleEntry(state, signal, action, next_state, meta))
 
+    @property
+    def finalized(self) -> bool:
+        return isinstance(self.rules, tuple)
+
+    def finalize(self) -> "RuleTable":
+        """Freeze the rules once the table is built.
+
+        The rules become a tuple and (state, signal) lookups go through a
+        read-only index. First match wins, same as the linear scan."""
+        self.rules = tuple(self.rules)
+        index: dict[tuple[AgentState, Signal], RuleEntry] = {}
+        for rule in self.rules:
+            index.setdefault((rule.state, rule.signal), rule)
+        self._index = MappingProxyType(index)
+        return self
+
+    def __getstate__(self) -> dict:
+        # mappingproxy can't be pickled/deep-copied; rebuild it on load
+        state = self.__dict__.copy()
+        state["_index"] = None
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        if self.finalized:
+            self.finalize()
+
     def lookup(self, state: AgentState, signal: Signal) -> RuleEntry | None:
+        if self._index is not None:
+            return self._index.get((state, signal))
         for rule in self.rules:
             if rule.state == state and rule.signal == signal:
                 return rule
@@ -77,16 +128,7 @@ class RuleTable:
         return {
             "name": self.name,
             "description": self.description,
-            "rules": [
-                {
-                    "state": r.state.value,
-                    "signal": r.signal.value,
-                    "action": r.action.value,
-                    "next_state": r.next_state.value,
-                    "metadata": r.metadata,
-                }
-                for r in self.rules
-            ],
+            "rules": [r.to_dict() for r in self.rules],
         }
 
 
@@ -103,7 +145,7 @@ def research_rules() -> RuleTable:
     rt.add(AgentState.WORKING, Signal.DEADLINE_NEAR, Action.EMIT, AgentState.IDLE, note="ship what you have")
     rt.add(AgentState.IDLE, Signal.STALE, Action.GAP_ANALYSIS, AgentState.WORKING,
            note="anti-quiescence: find gaps while neighbors are active")
-    return rt
+    return rt.finalize()
 
 
 def concept_rules() -> RuleTable:
@@ -116,7 +158,7 @@ def concept_rules() -> RuleTable:
     rt.add(AgentState.IDLE, Signal.QUEUE_EMPTY, Action.PULL, AgentState.IDLE, note="pull from research queue")
     rt.add(AgentState.IDLE, Signal.STALE, Action.GAP_ANALYSIS, AgentState.WORKING,
            note="anti-quiescence: find conceptual gaps")
-    return rt
+    return rt.finalize()
 
 
 def layout_rules() -> RuleTable:
@@ -132,7 +174,7 @@ def layout_rules() -> RuleTable:
            note="break monotony -- if neighbor is idle, consider visual variety")
     rt.add(AgentState.IDLE, Signal.STALE, Action.GAP_ANALYSIS, AgentState.WORKING,
            note="anti-quiescence: look for layout gaps")
-    return rt
+    return rt.finalize()
 
 
 def critique_rules() -> RuleTable:
@@ -144,7 +186,7 @@ def critique_rules() -> RuleTable:
     rt.add(AgentState.IDLE, Signal.QUEUE_EMPTY, Action.WAIT, AgentState.IDLE)
     rt.add(AgentState.IDLE, Signal.STALE, Action.CHALLENGE, AgentState.CRITIQUING,
            note="anti-quiescence: challenge neighbors when idle too long")
-    return rt
+    return rt.finalize()
 
 
 ALL_RULE_TABLES = {
@@ -173,7 +215,7 @@ def master_rules() -> RuleTable:
            note="ship best available")
     rt.add(AgentState.IDLE, Signal.STALE, Action.GAP_ANALYSIS, AgentState.WORKING,
            note="anti-quiescence: re-examine brief for missed angles")
-    return rt
+    return rt.finalize()
 
 
 def sub_agent_rules(strictness: float = 0.8) -> RuleTable:
@@ -201,7 +243,7 @@ def sub_agent_rules(strictness: float = 0.8) -> RuleTable:
            note="unblock on new input")
     rt.add(AgentState.IDLE, Signal.STALE, Action.GAP_ANALYSIS, AgentState.WORKING,
            note="anti-quiescence: look for gaps in domain coverage")
-    return rt
+    return rt.finalize()
 
 
 def execution_rules() -> RuleTable:
@@ -218,12 +260,25 @@ def execution_rules() -> RuleTable:
     rt.add(AgentState.WORKING, Signal.DEADLINE_NEAR, Action.EMIT, AgentState.IDLE)
     rt.add(AgentState.IDLE, Signal.STALE, Action.PULL, AgentState.IDLE,
            note="anti-quiescence: pull work from busy neighbors")
-    return rt
+    return rt.finalize()
 
 
 def generate_rule_table(role: str, strictness: float = 0.8) -> RuleTable:
     """Generate a rule table for any agent role.
-    NKS: each cell type has its own simple rule set."""
+    NKS: each cell type has its own simple rule set.
+
+    Tables are finalized (read-only), so one instance is shared by every
+    cell with the same role and strictness."""
+    if role in _STRICTNESS_INDEPENDENT_ROLES:
+        return _shared_rule_table(role, 0.8)
+    return _shared_rule_table(role, strictness)
+
+
+_STRICTNESS_INDEPENDENT_ROLES = frozenset({"master", "critique", "research", "execution"})
+
+
+@lru_cache(maxsize=128)
+def _shared_rule_table(role: str, strictness: float) -> RuleTable:
     if role == "master":
         return master_rules()
     elif role == "critique":
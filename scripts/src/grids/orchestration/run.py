@@ -10,58 +10,230 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import hashlib
+import itertools
 import json
 import os
+import queue
 import re
 import sys
+import threading
 import time
+from collections import Counter, defaultdict
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field, is_dataclass
+from functools import cache, lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
+try:
+    import orjson
+except ImportError:  # optional: faster stream log serialization
+    orjson = None
 
 from grids.orchestration.grid import AgentGrid, Neighborhood
-from grids.orchestration.seed import seed_from_domains, seed_from_yaml, seed_phase1b, seed_phase2, inject_brief
-from grids.orchestration.tick import run, RunResult
-from grids.orchestration.invoke import make_invoke_fn, consolidate_analysis, consolidate_product_spec
-from grids.orchestration.validate import validate_build, ValidationResult as BuildValidationResult
 
-console = Console(stderr=True)
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from grids.orchestration.tick import RunResult, TickResult
+    from grids.orchestration.validate import ValidationResult as BuildValidationResult
+
+
+# Stream events are serialized and written by a background thread in
+# batches of up to this many events, with one flush per batch.
+STREAM_WRITE_BATCH = 128
+STREAM_QUEUE_SIZE = 10_000
+
+# Code artifact files are written concurrently (I/O-bound).
+ARTIFACT_WRITE_WORKERS = min(16, (os.cpu_count() or 1) * 4)
+
+# full path -> blake2b digest of the content _write_code_artifacts last wrote
+_written_file_digests: dict[str, bytes] = {}
+
+
+@cache
+def _console() -> Console:
+    """Shared stderr console, created on first use so --help/--json skip rich."""
+    from rich.console import Console
+
+    return Console(stderr=True)
+
+
+@dataclass(slots=True)
+class TickLogRecord:
+    """A "tick" stream event. Built on the tick thread in place of an event
+    dict; serialized by the writer thread (orjson encodes it natively)."""
+    seq: int
+    ts_ms: int
+    tick: int
+    actions: int
+    llm_calls: int
+    emitted: int
+    elapsed: float
+    routing_scheduled: int
+    routing_delivered: int
+    routing_rejected: int
+    critique_scores: list[float] = field(default_factory=list)
+    critique_verdicts: list[str] = field(default_factory=list)
+    rework_count: int = 0
+    cache_hits: int = 0
+    type: str = "tick"
+
+
+def _json_default(obj):
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    return str(obj)
+
+
+def _jsonl_line(entry: dict | TickLogRecord) -> bytes:
+    """Serialize one stream event as a UTF-8 JSON line (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(entry, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(entry, default=_json_default) + "\n").encode("utf-8")
 
 
 class StreamLogger:
-    """Captures every LLM call + tick event to a JSONL file for analysis."""
+    """Captures every LLM call + tick event to a JSONL file for analysis.
+
+    log() only enqueues; a daemon writer thread serializes and writes, so
+    the tick loop never blocks on disk I/O. log() may be called from any
+    thread; file access is serialized by _io_lock.
+
+    Events carry "ts_ms", integer milliseconds on a monotonic clock since the
+    logger was created; run_start events carry "start_wall_ts" (epoch seconds)
+    so readers can reconstruct wall-clock time."""
 
     def __init__(self, path: str):
         self._path = path
-        self._f = open(path, "w", encoding="utf-8")
-        self._seq = 0
-        self._phase_entries: list[str] = []
+        self.start_wall_ts = time.time()
+        self._mono0 = time.monotonic_ns()
+        self._f = open(path, "wb", buffering=1 << 16)
+        self._seq = itertools.count(1)
+        self._io_lock = threading.Lock()
+        self._phase_start_offset = 0
+        self._pending: list[Future] = []
+        # First write error from the writer thread, re-raised by flush()/close()
+        self._error: BaseException | None = None
+        self._q: queue.Queue[dict | TickLogRecord | None] = queue.Queue(maxsize=STREAM_QUEUE_SIZE)
+        self._thread = threading.Thread(target=self._writer_loop, name="grids-stream-log", daemon=True)
+        self._thread.start()
+
+    def _ts_ms(self) -> int:
+        return (time.monotonic_ns() - self._mono0) // 1_000_000
 
     def log(self, event_type: str, **data):
-        self._seq += 1
-        entry = {"seq": self._seq, "ts": time.time(), "type": event_type, **data}
-        line = json.dumps(entry, default=str) + "\n"
-        self._f.write(line)
-        self._f.flush()
-        self._phase_entries.append(line)
+        self._q.put({"seq": next(self._seq), "ts_ms": self._ts_ms(), "type": event_type, **data})
+
+    def log_tick(self, result: TickResult):
+        """Log a tick event as a TickLogRecord rather than going through
+        log()'s kwargs/dict expansion, since this fires every tick."""
+        self._q.put(TickLogRecord(
+            next(self._seq), self._ts_ms(),
+            result.tick,
+            result.actions_taken,
+            result.llm_calls,
+            result.items_emitted,
+            result.elapsed_seconds,
+            result.propagations + result.rejected,
+            result.propagations,
+            result.rejected,
+            result.critique_scores,
+            result.critique_verdicts,
+            result.rework_count,
+            result.cache_hits,
+        ))
 
-    def start_phase(self):
-        """Mark the start of a new phase. Resets the per-phase buffer."""
-        self._phase_entries = []
+    def _writer_loop(self):
+        q = self._q
+        while True:
+            batch = [q.get()]
+            while len(batch) < STREAM_WRITE_BATCH:
+                try:
+                    batch.append(q.get_nowait())
+                except queue.Empty:
+                    break
+            stop = False
+            lines = []
+            for entry in batch:
+                if entry is None:
+                    stop = True
+                    continue
+                try:
+                    lines.append(_jsonl_line(entry))
+                except (TypeError, ValueError) as e:
+                    seq = entry.seq if isinstance(entry, TickLogRecord) else entry.get("seq")
+                    lines.append(_jsonl_line({"seq": seq, "type": "log_error", "error": str(e)}))
+            try:
+                # After a failed write, keep draining so log() and flush()
+                # never block on a dead writer; the error surfaces in flush()
+                if self._error is None:
+                    with self._io_lock:
+                        self._f.write(b"".join(lines))
+                        self._f.flush()
+            except Exception as e:
+                self._error = e
+            finally:
+                for _ in batch:
+                    q.task_done()
+            if stop:
+                return
+
+    def _raise_writer_error(self):
+        if self._error is not None:
+            raise self._error
 
-    def save_phase_stream(self, phase_dir: str, run_start_data: dict | None = None):
-        """Save the accumulated phase entries as a standalone stream.jsonl in the phase dir."""
+    def flush(self):
+        """Block until every event logged so far is written to disk.
+
+        Re-raises the writer thread's error if a write failed."""
+        self._q.join()
+        self._raise_writer_error()
+
+    def start_phase(self):
+        """Mark the start of a new phase. Later events belong to this phase."""
+        self.flush()
+        with self._io_lock:
+            self._phase_start_offset = self._f.tell()
+
+    def save_phase_stream(self, phase_dir: str, run_start_data: dict | None = None,
+                          executor: Executor | None = None):
+        """Save the events logged since start_phase() as a standalone stream.jsonl
+        in the phase dir, copied straight from the main stream file.
+
+        The phase's byte range is fixed here; with an executor the copy runs
+        in the background (later phases keep logging) and close() waits for it.
+        """
+        self.flush()
+        with self._io_lock:
+            start, end = self._phase_start_offset, self._f.tell()
         path = os.path.join(phase_dir, "stream.jsonl")
-        with open(path, "w", encoding="utf-8") as f:
-            if run_start_data:
-                f.write(json.dumps(run_start_data, default=str) + "\n")
-            for line in self._phase_entries:
-                f.write(line)
+        if executor is None:
+            self._copy_span(path, start, end, run_start_data)
+        else:
+            self._pending.append(executor.submit(self._copy_span, path, start, end, run_start_data))
+
+    def _copy_span(self, path: str, start: int, end: int, run_start_data: dict | None):
+        with open(self._path, "rb") as src:
+            src.seek(start)
+            payload = src.read(end - start)
+        if run_start_data:
+            header = {"ts_ms": 0, **run_start_data, "start_wall_ts": self.start_wall_ts}
+            payload = _jsonl_line(header) + payload
+        Path(path).write_bytes(payload)
 
     def close(self):
+        # The writer drains everything queued before the sentinel, then exits;
+        # it never blocks on anything but the queue, so wait for it in full
+        # rather than closing the file under it.
+        self._q.put(None)
+        self._thread.join()
         self._f.close()
+        for fut in self._pending:
+            fut.result()
+        self._pending.clear()
+        self._raise_writer_error()
 
 
 def main():
@@ -117,8 +289,17 @@ def main():
                         help="Max rework iterations for Phase 2b validation (default: 2)")
     parser.add_argument("--phase2b-rework-ticks", type=int, default=8,
                         help="Max ticks per Phase 2b rework iteration (default: 8)")
+    parser.add_argument("--phase2b-shards", type=int, default=1,
+                        help="Split each rework iteration into up to N parallel grids by affected file "
+                             "(default: 1; ignored with --tui)")
     parser.add_argument("--no-screenshots", action="store_true",
                         help="Skip screenshot capture during Phase 2b validation")
+    parser.add_argument("--invoke-workers", type=int, default=4,
+                        help="Max concurrent LLM calls within a tick (default: 4; 1 = sequential; ignored with --tui)")
+    parser.add_argument("--no-rework-cache", action="store_true",
+                        help="Don't reuse Phase 2 LLM responses for unchanged cells in Phase 2b rework")
+    parser.add_argument("--no-consolidation-cache", action="store_true",
+                        help="Always re-run phase-bridge consolidation LLM calls (skip tmp/llm-cache)")
     args = parser.parse_args()
 
     # Rule space search mode (no grid run, just rule evaluation)
@@ -126,14 +307,10 @@ def main():
         _run_rule_search(args)
         return
 
+    from grids.orchestration.seed import seed_from_domains, seed_from_yaml, inject_brief
+
     # Resolve brief
-    brief_text = None
-    if args.brief:
-        if args.brief.startswith("@") and os.path.isfile(args.brief[1:]):
-            with open(args.brief[1:], "r", encoding="utf-8") as f:
-                brief_text = f.read().strip()
-        else:
-            brief_text = args.brief
+    brief_text = _load_brief(args.brief) if args.brief else None
 
     # Build grid
     seed_config = {}
@@ -167,7 +344,7 @@ def main():
         inject_brief(grid, brief_text)
 
     if not brief_text and not args.seed:
-        console.print("[red]No brief provided. Use positional argument or --seed.[/red]")
+        _console().print("[red]No brief provided. Use positional argument or --seed.[/red]")
         sys.exit(1)
 
     # Output directory
@@ -176,20 +353,23 @@ def main():
 
     # Print header
     if not args.json:
-        console.print(Panel(
+        from rich.panel import Panel
+
+        _console().print(Panel(
             brief_text or "(from seed file)",
             title="ANKOS Grid Run",
             border_style="cyan",
         ))
         _print_grid_info(grid)
-        console.print()
+        _console().print()
 
     # Stream logger
     stream_logger = None
     if args.log_stream:
         stream_log_path = os.path.join(output_dir, "stream.jsonl")
         stream_logger = StreamLogger(stream_log_path)
-        stream_logger.log("run_start", brief=brief_text, seed=args.seed,
+        stream_logger.log("run_start", start_wall_ts=stream_logger.start_wall_ts,
+                          brief=brief_text, seed=args.seed,
                           grid_size=f"{grid.width}x{grid.height}",
                           cell_count=len(grid.cells))
 
@@ -198,6 +378,9 @@ def main():
         _run_phased(args, grid, seed_config if args.seed else {}, brief_text, output_dir, stream_logger)
         return
 
+    from grids.orchestration.invoke import make_invoke_fn
+    from grids.orchestration.tick import run
+
     # Record-only mode (no TUI)
     if args.record:
         from grids.orchestration.recorder import VideoRecorder
@@ -215,20 +398,10 @@ def main():
             recorder.on_tick(result)
             recorder.write_hold(seconds=0.5)
             if stream_logger:
-                stream_logger.log("tick", tick=result.tick,
-                                  actions=result.actions_taken,
-                                  llm_calls=result.llm_calls,
-                                  emitted=result.items_emitted,
-                                  elapsed=result.elapsed_seconds,
-                                  routing_scheduled=result.propagations + result.rejected,
-                                  routing_delivered=result.propagations,
-                                  routing_rejected=result.rejected,
-                                  critique_scores=result.critique_scores,
-                                  critique_verdicts=result.critique_verdicts,
-                                  rework_count=result.rework_count)
+                stream_logger.log_tick(result)
             if args.ascii:
-                console.print(f"\n[dim]--- Tick {result.tick} ---[/dim]")
-                console.print(grid.ascii_view())
+                _console().print(f"\n[dim]--- Tick {result.tick} ---[/dim]")
+                _console().print(grid.ascii_view())
 
         result = run(
             grid,
@@ -237,12 +410,13 @@ def main():
             quiescence_ticks=args.quiescence,
             verbose=not args.json,
             on_tick=on_tick_recorded,
+            max_workers=args.invoke_workers,
         )
 
         recorder.add_stream_event("--- RUN COMPLETE ---")
         recorder.write_hold(seconds=3.0)
         recorder.stop()
-        console.print(f"\n[green]Video saved: {video_path}[/green]")
+        _console().print(f"\n[green]Video saved: {video_path}[/green]")
 
         _save_results(output_dir, grid, result, brief_text)
         _close_logger(stream_logger, result, output_dir)
@@ -253,22 +427,14 @@ def main():
     # Standard mode (no TUI, no recording)
     invoke_fn = _wrap_with_logger(make_invoke_fn(verbose=args.verbose), stream_logger)
 
-    def on_tick(result):
+    def print_tick(result):
         if stream_logger:
-            stream_logger.log("tick", tick=result.tick,
-                              actions=result.actions_taken,
-                              llm_calls=result.llm_calls,
-                              emitted=result.items_emitted,
-                              elapsed=result.elapsed_seconds,
-                              routing_scheduled=result.propagations + result.rejected,
-                              routing_delivered=result.propagations,
-                              routing_rejected=result.rejected,
-                              critique_scores=result.critique_scores,
-                              critique_verdicts=result.critique_verdicts,
-                              rework_count=result.rework_count)
-        if args.ascii:
-            console.print(f"\n[dim]--- Tick {result.tick} ---[/dim]")
-            console.print(grid.ascii_view())
+            stream_logger.log_tick(result)
+        _console().print(f"\n[dim]--- Tick {result.tick} ---[/dim]")
+        _console().print(grid.ascii_view())
+
+    # Skip the per-tick callback entirely unless it has something to do
+    on_tick = print_tick if args.ascii else _make_tick_logger(stream_logger)
 
     result = run(
         grid,
@@ -277,6 +443,7 @@ def main():
         quiescence_ticks=args.quiescence,
         verbose=not args.json,
         on_tick=on_tick,
+        max_workers=args.invoke_workers,
     )
 
     # Save results
@@ -293,7 +460,7 @@ def main():
             "output_dir": output_dir,
         }, indent=2))
     else:
-        console.print()
+        _console().print()
         _print_summary(result, output_dir)
 
     # Auto-generate report if requested
@@ -301,6 +468,17 @@ def main():
         _run_report(output_dir)
 
 
+def _load_brief(arg: str) -> str:
+    """Resolve the brief argument: "@path" reads that file, anything else
+    (including an "@..." that isn't a readable file) is the brief itself."""
+    if arg.startswith("@"):
+        try:
+            return Path(arg[1:]).read_text(encoding="utf-8").strip()
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            pass
+    return arg
+
+
 def _run_phased(args, grid, seed_config, brief_text, output_dir, stream_logger):
     """Run the three-phase pipeline: 1a (domain analysis) -> 1b (product spec) -> 2 (build).
 
@@ -314,10 +492,31 @@ def _run_phased(args, grid, seed_config, brief_text, output_dir, stream_logger):
     Each phase runs its own grid to quiescence (or tick limit), then a
     consolidation LLM call bridges to the next phase.
     """
-    from grids.orchestration.tui import run_with_tui
+    # Result saving and JSON writes run on this pool so they overlap the
+    # consolidation LLM calls and the next phase's grid seeding.
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="grids-io") as io_pool:
+        _run_phases(args, grid, seed_config, brief_text, output_dir, stream_logger, io_pool)
+
+
+def _run_phases(args, grid, seed_config, brief_text, output_dir, stream_logger,
+                io_pool: ThreadPoolExecutor):
+    """Body of _run_phased; io_pool is shut down (joined) by the caller."""
+    from rich.panel import Panel
+
+    from grids.orchestration.invoke import make_invoke_fn, consolidate_analysis, consolidate_product_spec
     from grids.orchestration.seed import seed_phase1b, seed_phase2
+    from grids.orchestration.tick import run
+
+    if args.tui:
+        from grids.orchestration.tui import run_with_tui
 
     phases_to_run = args.phases
+
+    # One invoke callback for every non-TUI phase grid (it is stateless; the
+    # LLM HTTP client behind it is shared at module level in agents.py)
+    invoke_fn = None
+    if not args.tui:
+        invoke_fn = _wrap_with_logger(make_invoke_fn(verbose=args.verbose), stream_logger)
     project_config = seed_config.get("project", {})
     domains = seed_config.get("domains", [])
     complexity_budget = seed_config.get("complexity_budget", {})
@@ -331,14 +530,14 @@ def _run_phased(args, grid, seed_config, brief_text, output_dir, stream_logger):
 
     # Build a run_start dict for per-phase streams
     _phase_run_start = {
-        "seq": 0, "ts": time.time(), "type": "run_start",
+        "seq": 0, "type": "run_start",
         "brief": brief_text,
         "seed": getattr(args, "seed", None) or "",
     }
 
     # --- Phase 1a: Domain Analysis ---
     if phases_to_run in ("1a", "all"):
-        console.print(Panel(
+        _console().print(Panel(
             f"Domain experts analyze the brief through {len(grid.cells)} cells.",
             title="Phase 1a: Domain Analysis",
             border_style="cyan",
@@ -359,10 +558,10 @@ def _run_phased(args, grid, seed_config, brief_text, output_dir, stream_logger):
                 stream_logger=stream_logger,
             )
         else:
-            invoke_fn = _wrap_with_logger(make_invoke_fn(verbose=args.verbose), stream_logger)
             result_1a = run(grid, invoke_fn, max_ticks=args.phase1a_ticks,
                             quiescence_ticks=args.quiescence, verbose=not args.json,
-                            on_tick=_make_tick_logger(stream_logger))
+                            on_tick=_make_tick_logger(stream_logger),
+                            max_workers=args.invoke_workers)
 
         total_llm += result_1a.total_llm_calls
         total_ticks += result_1a.total_ticks
@@ -370,13 +569,13 @@ def _run_phased(args, grid, seed_config, brief_text, output_dir, stream_logger):
         # Save Phase 1a results
         phase1a_dir = os.path.join(output_dir, "phase-1a")
         os.makedirs(phase1a_dir, exist_ok=True)
-        _save_results(phase1a_dir, grid, result_1a, brief_text)
+        saved_1a = io_pool.submit(_save_results, phase1a_dir, grid, result_1a, brief_text)
         if stream_logger:
             rs = {**_phase_run_start, "grid_size": f"{grid.width}x{grid.height}", "cell_count": len(grid.cells)}
-            stream_logger.save_phase_stream(phase1a_dir, run_start_data=rs)
+            stream_logger.save_phase_stream(phase1a_dir, run_start_data=rs, executor=io_pool)
 
         if not args.json:
-            console.print(Panel(
+            _console().print(Panel(
                 f"Ticks: {result_1a.total_ticks} | LLM calls: {result_1a.total_llm_calls} | "
                 f"Items: {result_1a.total_items_emitted}",
                 title="Phase 1a Complete",
@@ -384,45 +583,49 @@ def _run_phased(args, grid, seed_config, brief_text, output_dir, stream_logger):
             ))
 
         if phases_to_run == "1a":
+            saved_1a.result()
             _print_phase_summary(output_dir, total_ticks, total_llm, all_artifacts)
             if stream_logger:
                 stream_logger.close()
             return
 
         # Bridge: consolidate domain analysis
-        console.print("\n[bold magenta]Consolidating domain analysis...[/bold magenta]")
+        _console().print("\n[bold magenta]Consolidating domain analysis...[/bold magenta]")
         if stream_logger:
             stream_logger.log("consolidation_start", phase="1a->1b")
 
-        domain_analysis = consolidate_analysis(grid, brief_text, project_config)
-        total_llm += 1
+        domain_analysis, cache_hit = _consolidate(
+            args, "analysis", consolidate_analysis, grid, brief_text, project_config,
+        )
+        total_llm += 0 if cache_hit else 1
+        saved_1a.result()
 
-        # Save the analysis
+        # Save the analysis (joined once the Phase 1b grid is seeded)
         analysis_path = os.path.join(output_dir, "domain-analysis.json")
-        with open(analysis_path, "w", encoding="utf-8") as f:
-            json.dump(domain_analysis, f, indent=2, default=str)
-        console.print(f"  [green]Domain analysis saved: {analysis_path}[/green]")
+        analysis_written = io_pool.submit(_write_json, analysis_path, domain_analysis)
 
         if stream_logger:
             stream_logger.log("consolidation_end", phase="1a->1b",
                               output_path=analysis_path,
-                              output_preview=str(domain_analysis)[:500])
+                              output_preview=_preview(domain_analysis, 500))
     else:
         domain_analysis = None
+        analysis_written = None
 
     # --- Phase 1b: Product Specification ---
     if phases_to_run in ("1b", "all"):
-        # If running 1b standalone, load analysis from file
-        if domain_analysis is None:
+        # If running 1b standalone, load analysis from file. In a full run the
+        # consolidated analysis is already in memory (and may still be being
+        # written by io_pool), so never read it back.
+        if phases_to_run == "1b":
             analysis_path = os.path.join(output_dir, "domain-analysis.json")
             if os.path.exists(analysis_path):
-                with open(analysis_path, "r", encoding="utf-8") as f:
-                    domain_analysis = json.load(f)
+                domain_analysis = _read_json(analysis_path)
             else:
-                console.print("[red]No domain analysis found. Run Phase 1a first or provide --spec-input.[/red]")
+                _console().print("[red]No domain analysis found. Run Phase 1a first or provide --spec-input.[/red]")
                 return
 
-        console.print(Panel(
+        _console().print(Panel(
             "Product-designer, systems-architect, UX-specifier, integration-planner, "
             "and product-critique cells iterate to produce a concrete product spec.",
             title="Phase 1b: Product Specification",
@@ -435,6 +638,9 @@ def _run_phased(args, grid, seed_config, brief_text, output_dir, stream_logger):
             project_config=project_config,
             complexity_budget=complexity_budget,
         )
+        if analysis_written is not None:
+            analysis_written.result()
+            _console().print(f"  [green]Domain analysis saved: {analysis_path}[/green]")
 
         if stream_logger:
             stream_logger.start_phase()
@@ -454,10 +660,10 @@ def _run_phased(args, grid, seed_config, brief_text, output_dir, stream_logger):
                 stream_logger=stream_logger,
             )
         else:
-            invoke_fn = _wrap_with_logger(make_invoke_fn(verbose=args.verbose), stream_logger)
             result_1b = run(grid_1b, invoke_fn, max_ticks=args.phase1b_ticks,
                             quiescence_ticks=args.quiescence, verbose=not args.json,
-                            on_tick=_make_tick_logger(stream_logger))
+                            on_tick=_make_tick_logger(stream_logger),
+                            max_workers=args.invoke_workers)
 
         total_llm += result_1b.total_llm_calls
         total_ticks += result_1b.total_ticks
@@ -465,13 +671,13 @@ def _run_phased(args, grid, seed_config, brief_text, output_dir, stream_logger):
         # Save Phase 1b results
         phase1b_dir = os.path.join(output_dir, "phase-1b")
         os.makedirs(phase1b_dir, exist_ok=True)
-        _save_results(phase1b_dir, grid_1b, result_1b, brief_text)
+        saved_1b = io_pool.submit(_save_results, phase1b_dir, grid_1b, result_1b, brief_text)
         if stream_logger:
             rs = {**_phase_run_start, "grid_size": f"{grid_1b.width}x{grid_1b.height}", "cell_count": len(grid_1b.cells)}
-            stream_logger.save_phase_stream(phase1b_dir, run_start_data=rs)
+            stream_logger.save_phase_stream(phase1b_dir, run_start_data=rs, executor=io_pool)
 
         if not args.json:
-            console.print(Panel(
+            _console().print(Panel(
                 f"Ticks: {result_1b.total_ticks} | LLM calls: {result_1b.total_llm_calls} | "
                 f"Items: {result_1b.total_items_emitted}",
                 title="Phase 1b Complete",
@@ -479,58 +685,61 @@ def _run_phased(args, grid, seed_config, brief_text, output_dir, stream_logger):
             ))
 
         if phases_to_run == "1b":
+            saved_1b.result()
             _print_phase_summary(output_dir, total_ticks, total_llm, all_artifacts)
             if stream_logger:
                 stream_logger.close()
             return
 
         # Bridge: consolidate product spec from Phase 1b grid
-        console.print("\n[bold magenta]Consolidating product specification...[/bold magenta]")
+        _console().print("\n[bold magenta]Consolidating product specification...[/bold magenta]")
         if stream_logger:
             stream_logger.log("consolidation_start", phase="1b->2")
 
-        product_spec = consolidate_product_spec(grid_1b, brief_text, project_config, complexity_budget)
-        total_llm += 2  # merge pass + convergence pass
+        product_spec, cache_hit = _consolidate(
+            args, "product_spec", consolidate_product_spec,
+            grid_1b, brief_text, project_config, complexity_budget,
+        )
+        total_llm += 0 if cache_hit else 2  # merge pass + convergence pass
+        saved_1b.result()
 
+        # Save the spec (joined once the Phase 2 grid is seeded)
         spec_path = os.path.join(output_dir, "product-spec.json")
-        with open(spec_path, "w", encoding="utf-8") as f:
-            json.dump(product_spec, f, indent=2, default=str)
-        console.print(f"  [green]Product spec saved: {spec_path}[/green]")
+        spec_written = io_pool.submit(_write_json, spec_path, product_spec)
 
         if stream_logger:
             stream_logger.log("consolidation_end", phase="1b->2",
                               output_path=spec_path,
-                              output_preview=str(product_spec)[:500])
+                              output_preview=_preview(product_spec, 500))
     else:
         product_spec = None
+        spec_written = None
 
     # --- Phase 2: Execution (Build) ---
     if phases_to_run in ("2", "all"):
         # If running Phase 2 standalone, load spec from file
-        if product_spec is None:
+        if phases_to_run == "2":
             if args.spec_input:
                 spec_path = args.spec_input
             else:
                 spec_path = os.path.join(output_dir, "product-spec.json")
             if os.path.exists(spec_path):
-                with open(spec_path, "r", encoding="utf-8") as f:
-                    product_spec = json.load(f)
+                product_spec = _read_json(spec_path)
             else:
-                console.print("[red]No product spec found. Run Phase 1b first or provide --spec-input.[/red]")
+                _console().print("[red]No product spec found. Run Phase 1b first or provide --spec-input.[/red]")
                 return
 
-        console.print(Panel(
+        _console().print(Panel(
             "Coder, tester, and runner cells build working software from the product spec.",
             title="Phase 2: Build",
             border_style="bright_white",
         ))
 
         # Load domain analysis for consultant cells if available
-        if domain_analysis is None:
+        if phases_to_run == "2":
             da_path = os.path.join(output_dir, "domain-analysis.json")
             if os.path.exists(da_path):
-                with open(da_path, "r", encoding="utf-8") as f:
-                    domain_analysis = json.load(f)
+                domain_analysis = _read_json(da_path)
 
         activate_consultants = seed_config.get("execution", {}).get("activate_consultants", True)
 
@@ -541,6 +750,9 @@ def _run_phased(args, grid, seed_config, brief_text, output_dir, stream_logger):
             activate_consultants=activate_consultants,
             domain_analysis=domain_analysis,
         )
+        if spec_written is not None:
+            spec_written.result()
+            _console().print(f"  [green]Product spec saved: {spec_path}[/green]")
 
         if stream_logger:
             stream_logger.start_phase()
@@ -560,22 +772,26 @@ def _run_phased(args, grid, seed_config, brief_text, output_dir, stream_logger):
                 stream_logger=stream_logger,
             )
         else:
-            invoke_fn = _wrap_with_logger(make_invoke_fn(verbose=args.verbose), stream_logger)
+            if not args.no_rework_cache:
+                # Phase 2b rework grids reuse Phase 2 responses for unchanged inputs
+                invoke_fn = _with_response_cache(invoke_fn, stream_logger)
             result_2 = run(grid_2, invoke_fn, max_ticks=args.phase2_ticks,
                            quiescence_ticks=args.quiescence, verbose=not args.json,
-                           on_tick=_make_tick_logger(stream_logger))
+                           on_tick=_make_tick_logger(stream_logger),
+                           max_workers=args.invoke_workers)
 
         total_llm += result_2.total_llm_calls
         total_ticks += result_2.total_ticks
         all_artifacts.extend(result_2.artifacts)
 
         # Save Phase 2 results
+        # (runs alongside code writing and Phase 2b validation; joined below)
         phase2_dir = os.path.join(output_dir, "phase-2")
         os.makedirs(phase2_dir, exist_ok=True)
-        _save_results(phase2_dir, grid_2, result_2, brief_text)
+        saved_2 = io_pool.submit(_save_results, phase2_dir, grid_2, result_2, brief_text)
         if stream_logger:
             rs = {**_phase_run_start, "grid_size": f"{grid_2.width}x{grid_2.height}", "cell_count": len(grid_2.cells)}
-            stream_logger.save_phase_stream(phase2_dir, run_start_data=rs)
+            stream_logger.save_phase_stream(phase2_dir, run_start_data=rs, executor=io_pool)
 
         # Write code files to output directory
         _write_code_artifacts(output_dir, result_2, project_config)
@@ -594,15 +810,18 @@ def _run_phased(args, grid, seed_config, brief_text, output_dir, stream_logger):
                 seed_config=seed_config if args.seed else {},
                 stream_logger=stream_logger,
                 brief_text=brief_text,
+                invoke_fn=invoke_fn,
+                io_pool=io_pool,
             )
             total_llm += rework_llm
             total_ticks += rework_ticks
 
             # Save validation results
             val_path = os.path.join(output_dir, "validation-result.json")
-            with open(val_path, "w", encoding="utf-8") as f:
-                json.dump(validation_result.to_dict(), f, indent=2)
-            console.print(f"  [green]Validation results saved: {val_path}[/green]")
+            _write_json(val_path, validation_result.to_dict())
+            _console().print(f"  [green]Validation results saved: {val_path}[/green]")
+
+        saved_2.result()
 
     # Final summary
     _print_phase_summary(output_dir, total_ticks, total_llm, all_artifacts)
@@ -612,13 +831,42 @@ def _run_phased(args, grid, seed_config, brief_text, output_dir, stream_logger):
                           total_llm=total_llm,
                           artifacts=len(all_artifacts))
         stream_logger.close()
-        console.print(f"[green]Stream log: {os.path.join(output_dir, 'stream.jsonl')}[/green]")
+        _console().print(f"[green]Stream log: {os.path.join(output_dir, 'stream.jsonl')}[/green]")
 
     # Auto-generate report if requested
     if args.report and args.log_stream:
         _run_report(output_dir)
 
 
+def _consolidate(args, name: str, fn, grid, *fn_args):
+    """Run a phase-bridge consolidation, reusing a cached result for identical inputs.
+    Returns (result, cache_hit)."""
+    if args.no_consolidation_cache:
+        return fn(grid, *fn_args), False
+
+    from grids.orchestration.llm_cache import cached_consolidate
+
+    result, hit = cached_consolidate(name, fn, grid, *fn_args)
+    if hit:
+        _console().print(f"  [dim]Consolidation cache hit ({name}) -- skipped LLM call[/dim]")
+    return result, hit
+
+
+def _with_response_cache(invoke_fn, logger: StreamLogger | None):
+    """Wrap invoke_fn with an in-memory exact-match response cache."""
+    from grids.orchestration.llm_cache import cached_invoke_fn
+
+    if logger is None:
+        return cached_invoke_fn(invoke_fn, {})
+
+    def log_hit(cell, action):
+        logger.log("llm_cache_hit",
+                   domain=cell.domain, agent=cell.agent_type, action=action.value,
+                   pos=f"{cell.position[0]},{cell.position[1]}")
+
+    return cached_invoke_fn(invoke_fn, {}, log_hit)
+
+
 def _run_phase2b(
     args,
     app_dir: str,
@@ -630,6 +878,8 @@ def _run_phase2b(
     seed_config: dict,
     stream_logger: StreamLogger | None,
     brief_text: str = "",
+    invoke_fn=None,
+    io_pool: Executor | None = None,
 ) -> tuple[BuildValidationResult, int, int]:
     """Phase 2b: Build validation with rework loop (GRD-7).
 
@@ -637,10 +887,17 @@ def _run_phase2b(
     and optionally captures screenshots. If errors are found, re-seeds a
     mini execution grid with rework items and re-runs Phase 2, then
     re-writes code and re-validates. Repeats up to max_rework iterations.
+    Rework grids reuse invoke_fn when given (non-TUI runs). With io_pool,
+    each pass's result files are saved while its code files are written.
 
     Returns (final_validation_result, total_llm_calls, total_ticks).
     """
+    from rich.panel import Panel
+
+    from grids.orchestration.invoke import make_invoke_fn
     from grids.orchestration.seed import seed_phase2
+    from grids.orchestration.tick import run
+    from grids.orchestration.validate import validate_build
 
     max_rework = args.phase2b_max_rework
     rework_ticks = args.phase2b_rework_ticks
@@ -652,7 +909,7 @@ def _run_phase2b(
     for rework_iter in range(max_rework + 1):  # +1 for initial validation
         phase_label = "initial" if rework_iter == 0 else f"rework {rework_iter}"
 
-        console.print(Panel(
+        _console().print(Panel(
             f"Validating {app_dir} ({phase_label})",
             title="Phase 2b: Build Validation (GRD-7)",
             border_style="bright_white",
@@ -681,7 +938,7 @@ def _run_phase2b(
                               elapsed=validation_result.elapsed_seconds)
 
         if validation_result.passed:
-            console.print(Panel(
+            _console().print(Panel(
                 f"[bold green]Build validation passed ({phase_label})[/bold green]\n"
                 f"Screenshots: {len(validation_result.screenshots)}\n"
                 f"Warnings: {validation_result.warning_count}",
@@ -692,7 +949,7 @@ def _run_phase2b(
 
         # Validation failed -- check if we can rework
         if rework_iter >= max_rework:
-            console.print(Panel(
+            _console().print(Panel(
                 f"[bold yellow]Max rework iterations ({max_rework}) reached. "
                 f"{validation_result.error_count} errors remain.[/bold yellow]",
                 title="Phase 2b: Rework Exhausted",
@@ -703,78 +960,102 @@ def _run_phase2b(
         # Build rework items from validation errors
         rework_items = validation_result.to_rework_items()
         if not rework_items:
-            console.print("  [dim]No actionable rework items from validation[/dim]")
+            _console().print("  [dim]No actionable rework items from validation[/dim]")
             return validation_result, total_llm, total_ticks
 
-        console.print(
+        _console().print(
             f"\n[bold magenta]Rework: {len(rework_items)} issues to fix "
             f"(iteration {rework_iter + 1}/{max_rework})[/bold magenta]"
         )
 
-        # Re-seed Phase 2 grid with validation errors as rework context
+        # Re-seed Phase 2 grids with validation errors as rework context.
+        # Independent file groups can be fixed by separate grids in parallel.
         activate_consultants = seed_config.get("execution", {}).get("activate_consultants", True)
+        shards = _shard_rework_items(rework_items, 1 if args.tui else args.phase2b_shards)
+        grids_rework = [
+            seed_phase2(
+                consolidated_spec=_rework_spec(product_spec, items, rework_iter + 1),
+                project_config=project_config,
+                domains=domains,
+                activate_consultants=activate_consultants,
+                domain_analysis=domain_analysis,
+            )
+            for items in shards
+        ]
+        grid_rework = grids_rework[0]
+        cell_count = sum(len(g.cells) for g in grids_rework)
 
-        # Build an enriched spec that includes the original spec + validation errors
-        rework_spec = product_spec if isinstance(product_spec, dict) else {"spec": product_spec}
-        rework_spec = dict(rework_spec)  # don't mutate original
-        rework_spec["validation_errors"] = rework_items
-        rework_spec["rework_iteration"] = rework_iter + 1
-        rework_spec["rework_instructions"] = (
-            "CRITICAL: The previous code output had build validation errors. "
-            "You MUST fix ALL of the validation_errors listed below. "
-            "Each error includes the category, message, affected file, and a suggestion. "
-            "Focus on fixing these specific issues. Do not rewrite from scratch -- "
-            "patch the existing code to resolve each error."
-        )
-
-        grid_rework = seed_phase2(
-            consolidated_spec=rework_spec,
-            project_config=project_config,
-            domains=domains,
-            activate_consultants=activate_consultants,
-            domain_analysis=domain_analysis,
-        )
+        if len(shards) > 1:
+            _console().print(f"  [dim]Rework split into {len(shards)} parallel grids "
+                             f"({', '.join(str(len(items)) for items in shards)} issues)[/dim]")
 
         if stream_logger:
             stream_logger.start_phase()
             stream_logger.log("phase_start", phase=f"2-rework-{rework_iter + 1}",
                               grid_size=f"{grid_rework.width}x{grid_rework.height}",
-                              cell_count=len(grid_rework.cells),
-                              rework_items=len(rework_items))
+                              cell_count=cell_count,
+                              rework_items=len(rework_items),
+                              shards=len(shards))
 
         if args.tui:
             from grids.orchestration.tui import run_with_tui
-            result_rework = run_with_tui(
+            results_rework = [run_with_tui(
                 grid_rework,
                 max_ticks=rework_ticks,
                 quiescence_ticks=args.quiescence,
                 use_true_streaming=True,
                 stream_logger=stream_logger,
-            )
+            )]
         else:
-            invoke_fn = _wrap_with_logger(make_invoke_fn(verbose=args.verbose), stream_logger)
-            result_rework = run(grid_rework, invoke_fn, max_ticks=rework_ticks,
-                                quiescence_ticks=args.quiescence, verbose=True,
-                                on_tick=_make_tick_logger(stream_logger))
+            if invoke_fn is None:
+                invoke_fn = _wrap_with_logger(make_invoke_fn(verbose=args.verbose), stream_logger)
 
-        total_llm += result_rework.total_llm_calls
-        total_ticks += result_rework.total_ticks
+            def run_shard(g):
+                return run(g, invoke_fn, max_ticks=rework_ticks,
+                           quiescence_ticks=args.quiescence, verbose=len(grids_rework) == 1,
+                           on_tick=_make_tick_logger(stream_logger),
+                           max_workers=args.invoke_workers)
 
-        # Save rework results
+            if len(grids_rework) == 1:
+                results_rework = [run_shard(grid_rework)]
+            else:
+                with ThreadPoolExecutor(max_workers=len(grids_rework),
+                                        thread_name_prefix="grids-rework") as pool:
+                    results_rework = list(pool.map(run_shard, grids_rework))
+
+        rework_llm = sum(r.total_llm_calls for r in results_rework)
+        rework_ticks_run = sum(r.total_ticks for r in results_rework)
+        rework_items_emitted = sum(r.total_items_emitted for r in results_rework)
+        total_llm += rework_llm
+        total_ticks += rework_ticks_run
+
+        # Save rework results (one subdirectory per shard when split)
         rework_dir = os.path.join(output_dir, f"phase-2b-rework-{rework_iter + 1}")
         os.makedirs(rework_dir, exist_ok=True)
-        _save_results(rework_dir, grid_rework, result_rework, None)
+        saves = []
+        for k, (g, r) in enumerate(zip(grids_rework, results_rework)):
+            shard_dir = rework_dir if len(grids_rework) == 1 else os.path.join(rework_dir, f"shard-{k + 1}")
+            os.makedirs(shard_dir, exist_ok=True)
+            if io_pool is not None:
+                saves.append(io_pool.submit(_save_results, shard_dir, g, r, None))
+            else:
+                _save_results(shard_dir, g, r, None)
         if stream_logger:
-            rs = {"seq": 0, "ts": time.time(), "type": "run_start", "brief": brief_text,
-                  "grid_size": f"{grid_rework.width}x{grid_rework.height}", "cell_count": len(grid_rework.cells)}
-            stream_logger.save_phase_stream(rework_dir, run_start_data=rs)
+            rs = {"seq": 0, "type": "run_start", "brief": brief_text,
+                  "grid_size": f"{grid_rework.width}x{grid_rework.height}", "cell_count": cell_count}
+            stream_logger.save_phase_stream(rework_dir, run_start_data=rs, executor=io_pool)
 
         # Re-write code artifacts from rework output
-        _write_code_artifacts(output_dir, result_rework, project_config)
+        if len(results_rework) == 1:
+            _write_code_artifacts(output_dir, results_rework[0], project_config)
+        else:
+            _write_shard_code_artifacts(output_dir, results_rework, shards, project_config)
+        for fut in saves:
+            fut.result()
 
-        console.print(Panel(
-            f"Ticks: {result_rework.total_ticks} | LLM calls: {result_rework.total_llm_calls} | "
-            f"Items: {result_rework.total_items_emitted}",
+        _console().print(Panel(
+            f"Ticks: {rework_ticks_run} | LLM calls: {rework_llm} | "
+            f"Items: {rework_items_emitted}",
             title=f"Phase 2 Rework {rework_iter + 1} Complete",
             border_style="magenta",
         ))
@@ -783,19 +1064,76 @@ def _run_phase2b(
     return validation_result, total_llm, total_ticks
 
 
+# Relative fix effort per validation category, used to balance rework shards
+_REWORK_WEIGHTS = {
+    "dependency": 1,
+    "asset_missing": 1,
+    "route_conflict": 2,
+    "typescript": 2,
+    "runtime": 3,
+}
+
+
+def _rework_spec(product_spec, rework_items: list[dict], iteration: int) -> dict:
+    """Build an enriched spec: the original spec + validation errors to fix."""
+    rework_spec = product_spec if isinstance(product_spec, dict) else {"spec": product_spec}
+    rework_spec = dict(rework_spec)  # don't mutate original
+    rework_spec["validation_errors"] = rework_items
+    rework_spec["rework_iteration"] = iteration
+    rework_spec["rework_instructions"] = (
+        "CRITICAL: The previous code output had build validation errors. "
+        "You MUST fix ALL of the validation_errors listed below. "
+        "Each error includes the category, message, affected file, and a suggestion. "
+        "Focus on fixing these specific issues. Do not rewrite from scratch -- "
+        "patch the existing code to resolve each error."
+    )
+    return rework_spec
+
+
+def _shard_rework_items(rework_items: list[dict], max_shards: int) -> list[list[dict]]:
+    """Split rework items into at most max_shards disjoint groups.
+
+    Items touching the same file (or, without a file, of the same kind and
+    category) stay together so no two grids patch the same file. Groups are
+    packed largest-first into the currently lightest shard, weighted by
+    _REWORK_WEIGHTS, so shard runtimes come out similar.
+    """
+    if max_shards <= 1 or len(rework_items) <= 1:
+        return [rework_items]
+
+    groups: dict[str, list[dict]] = {}
+    for item in rework_items:
+        key = item.get("file") or f"{item.get('kind')}:{item.get('category', '')}"
+        groups.setdefault(key, []).append(item)
+
+    def weight(items: list[dict]) -> int:
+        return sum(_REWORK_WEIGHTS.get(i.get("category"), 3 if i.get("kind") == "visual_issue" else 2)
+                   for i in items)
+
+    shards: list[list[dict]] = [[] for _ in range(min(max_shards, len(groups)))]
+    loads = [0] * len(shards)
+    for items in sorted(groups.values(), key=weight, reverse=True):
+        k = loads.index(min(loads))
+        shards[k].extend(items)
+        loads[k] += weight(items)
+    return shards
+
+
 def _run_report(output_dir: str):
     """Run the analysis report generator on a completed run directory."""
     try:
         from grids.analysis.report import generate_report
-        console.print("\n[bold magenta]Generating session report...[/bold magenta]")
+        _console().print("\n[bold magenta]Generating session report...[/bold magenta]")
         generate_report(output_dir, use_llm=True, verbose=True)
     except Exception as e:
-        console.print(f"[yellow]Report generation failed: {e}[/yellow]")
+        _console().print(f"[yellow]Report generation failed: {e}[/yellow]")
 
 
 def _print_phase_summary(output_dir: str, total_ticks: int, total_llm: int, artifacts: list):
     """Print final cross-phase summary."""
-    console.print(Panel(
+    from rich.panel import Panel
+
+    _console().print(Panel(
         f"Total ticks: {total_ticks}\n"
         f"Total LLM calls: {total_llm}\n"
         f"Artifacts: {len(artifacts)}\n"
@@ -809,21 +1147,54 @@ def _print_phase_summary(output_dir: str, total_ticks: int, total_llm: int, arti
         path = os.path.join(output_dir, name)
         if os.path.exists(path):
             size = os.path.getsize(path)
-            console.print(f"  [green]{name}[/green] ({size:,} bytes)")
+            _console().print(f"  [green]{name}[/green] ({size:,} bytes)")
 
 
 def _write_code_artifacts(output_dir: str, result: RunResult, project_config: dict):
     """Extract code files from Phase 2 artifacts and write to disk."""
     app_dir = project_config.get("output_dir", os.path.join(output_dir, "app"))
-    files_written = 0
+    _write_code_files(app_dir, _collect_code_files(result, app_dir))
+
+
+def _write_shard_code_artifacts(
+    output_dir: str,
+    results: list[RunResult],
+    shards: list[list[dict]],
+    project_config: dict,
+):
+    """Write code files from parallel rework shards, one shard per file.
+
+    A file named by a shard's rework items is taken from that shard only,
+    so a shard can't overwrite another shard's fix. Any other file comes
+    from the first shard that produced it."""
+    app_dir = project_config.get("output_dir", os.path.join(output_dir, "app"))
+    owner: dict[str, int] = {}
+    for k, items in enumerate(shards):
+        for item in items:
+            if item.get("file"):
+                path = os.path.join(app_dir, _normalize_artifact_path(item["file"], app_dir))
+                owner.setdefault(path, k)
+
+    files: dict[str, str] = {}
+    for k, result in enumerate(results):
+        for path, content in _collect_code_files(result, app_dir).items():
+            if owner.get(path, k) == k:
+                files.setdefault(path, content)
+    _write_code_files(app_dir, files)
+
+
+def _collect_code_files(result: RunResult, app_dir: str) -> dict[str, str]:
+    """Code files in a run's artifacts: full path -> content.
+    Later artifacts win for the same path."""
+    files: dict[str, str] = {}
 
     for art in result.artifacts:
         content = art.get("content")
         file_list = _extract_file_list(content)
 
         if not file_list and content:
-            preview = str(content)[:120].replace("\n", " ")
-            console.print(f"  [yellow]Warning: could not extract files from artifact "
+            preview = _preview(content, 120).replace("\n", " ")
+            _console().print(f"  [yellow]Warning: could not extract files from artifact "
                           f"({art.get('source', '?')}): {preview}...[/yellow]")
 
         for file_spec in file_list:
@@ -839,19 +1210,47 @@ def _write_code_artifacts(output_dir: str, result: RunResult, project_config: di
             # we end up with a path relative to app_dir.
             file_path = _normalize_artifact_path(file_path, app_dir)
 
-            full_path = os.path.join(app_dir, file_path)
-            os.makedirs(os.path.dirname(full_path), exist_ok=True)
-            with open(full_path, "w", encoding="utf-8") as f:
-                f.write(file_content)
-            files_written += 1
+            files[os.path.join(app_dir, file_path)] = file_content
+
+    return files
+
+
+def _write_code_files(app_dir: str, files: dict[str, str]):
+    """Write code files (full path -> content) under app_dir."""
+    if not files:
+        return
+
+    # Skip files whose content matches what this process last wrote there
+    # (rework passes usually only touch the files tied to validation errors)
+    encoded = {path: text.encode("utf-8") for path, text in files.items()}
+    digests = {path: hashlib.blake2b(data, digest_size=16).digest() for path, data in encoded.items()}
+    changed = [
+        path for path in encoded
+        if _written_file_digests.get(path) != digests[path] or not os.path.exists(path)
+    ]
+    unchanged = len(files) - len(changed)
+
+    # Create each directory once up front so the pool only writes files
+    for parent in sorted({os.path.dirname(path) for path in changed}):
+        os.makedirs(parent, exist_ok=True)
 
-    if files_written:
-        console.print(f"\n[bold green]Wrote {files_written} code files to {app_dir}/[/bold green]")
+    if changed:
+        with ThreadPoolExecutor(max_workers=min(ARTIFACT_WRITE_WORKERS, len(changed))) as pool:
+            writes = {path: pool.submit(_write_bytes, path, encoded[path]) for path in changed}
+        for path, fut in writes.items():
+            fut.result()
+            _written_file_digests[path] = digests[path]
 
+    skipped = f" ({unchanged} unchanged)" if unchanged else ""
+    _console().print(f"\n[bold green]Wrote {len(changed)} code files to {app_dir}/{skipped}[/bold green]")
 
+
+@lru_cache(maxsize=4096)
 def _normalize_artifact_path(file_path: str, app_dir: str) -> str:
     """Normalize an LLM-emitted file path to be relative to app_dir.
 
+    Pure and memoized: artifacts repeat the same paths across patches.
+
     Handles patterns like:
       /home/user/apps/love-line/src/App.tsx  -> src/App.tsx
       apps/love-line/src/App.tsx             -> src/App.tsx
@@ -884,19 +1283,42 @@ def _normalize_artifact_path(file_path: str, app_dir: str) -> str:
     return file_path
 
 
+# File-extraction patterns for LLM artifact text (see _extract_file_list)
+
+# cat > path/to/file << 'EOF' ... EOF
+_HEREDOC_RE = re.compile(
+    r"cat\s+>\s*(\S+)\s*<<\s*['\"]?(\w+)['\"]?\s*\n"
+    r"(.*?)\n\2",
+    re.DOTALL,
+)
+
+# <file path="path/to/file"> ... </file>
+_XML_FILE_RE = re.compile(
+    r'<file\s+path="([^"]+)"[^>]*>\s*\n?(.*?)\s*</file>',
+    re.DOTALL,
+)
+
+# Both markdown conventions in one alternation so a single scan finds
+# either; groups 1-2 are the first form, 3-4 the second:
+#   ```lang path/to/file.ext  (filename on the fence line)
+#   // path/to/file.ext  or  **path/to/file.ext**  on the line before the fence
+_MD_FILE_BLOCK_RE = re.compile(
+    r"```\w*\s+([\w./()\[\]\-]+\.(?:tsx?|jsx?|json|m?js|css|md|ya?ml|toml|config\.\w+))\s*\n"
+    r"(.*?)\n```"
+    r"|(?:^|\n)\s*(?://|#|\*\*)\s*([\w./()\[\]\-]+\.(?:tsx?|jsx?|json|m?js|css|md|ya?ml|toml|config\.\w+))\s*\*{0,2}\s*\n"
+    r"```\w*\s*\n(.*?)\n```",
+    re.DOTALL,
+)
+
+
 def _extract_heredoc_files(text: str) -> list[dict]:
     """Extract files from shell heredoc patterns like:
     cat > path/to/file << 'EOF'
     ...content...
     EOF
     """
-    pattern = re.compile(
-        r"cat\s+>\s*(\S+)\s*<<\s*['\"]?(\w+)['\"]?\s*\n"
-        r"(.*?)\n\2",
-        re.DOTALL,
-    )
     files = []
-    for m in pattern.finditer(text):
+    for m in _HEREDOC_RE.finditer(text):
         path = m.group(1).strip()
         content = m.group(3)
         if path and content:
@@ -910,12 +1332,8 @@ def _extract_xml_file_tags(text: str) -> list[dict]:
     ...content...
     </file>
     """
-    pattern = re.compile(
-        r'<file\s+path="([^"]+)"[^>]*>\s*\n?(.*?)\s*</file>',
-        re.DOTALL,
-    )
     files = []
-    for m in pattern.finditer(text):
+    for m in _XML_FILE_RE.finditer(text):
         path = m.group(1).strip()
         content = m.group(2)
         if path and content:
@@ -941,36 +1359,22 @@ def _extract_markdown_file_blocks(text: str) -> list[dict]:
         ...code...
         ```
     """
-    files = []
-    # Pattern 1: ```lang path/to/file.ext  (filename on the fence line)
-    pattern1 = re.compile(
-        r"```\w*\s+([\w./()\[\]\-]+\.(?:tsx?|jsx?|json|m?js|css|md|ya?ml|toml|config\.\w+))\s*\n"
-        r"(.*?)\n```",
-        re.DOTALL,
-    )
-    for m in pattern1.finditer(text):
-        path = m.group(1).strip()
-        content = m.group(2)
-        if path and content and "/" in path:
-            files.append({"path": path, "content": content})
-
-    if files:
-        return files
+    if "```" not in text:
+        return []
 
-    # Pattern 2: filename on the line immediately before the fence
-    # Matches: // path/to/file.ext\n```lang  or  **path/to/file.ext**\n```lang
-    pattern2 = re.compile(
-        r"(?:^|\n)\s*(?://|#|\*\*)\s*([\w./()\[\]\-]+\.(?:tsx?|jsx?|json|m?js|css|md|ya?ml|toml|config\.\w+))\s*\*{0,2}\s*\n"
-        r"```\w*\s*\n(.*?)\n```",
-        re.DOTALL,
-    )
-    for m in pattern2.finditer(text):
-        path = m.group(1).strip()
-        content = m.group(2)
+    # Fence-line filenames take precedence; the preceding-line form is only
+    # used when no fence-line block was found.
+    fence_files = []
+    before_files = []
+    for m in _MD_FILE_BLOCK_RE.finditer(text):
+        if m.group(1) is not None:
+            path, content, out = m.group(1).strip(), m.group(2), fence_files
+        else:
+            path, content, out = m.group(3).strip(), m.group(4), before_files
         if path and content and "/" in path:
-            files.append({"path": path, "content": content})
+            out.append({"path": path, "content": content})
 
-    return files
+    return fence_files or before_files
 
 
 def _extract_file_list(content) -> list[dict]:
@@ -988,16 +1392,20 @@ def _extract_file_list(content) -> list[dict]:
         return []
 
     if isinstance(content, str):
+        # Each format below is only tried when its marker is present, so
+        # plain prose doesn't pay for a failed parse of every format.
+
         # Try to parse the whole string as JSON first
-        try:
-            parsed = json.loads(content)
-            return _extract_file_list(parsed)
-        except (json.JSONDecodeError, TypeError):
-            pass
+        if _JSON_START_RE.match(content):
+            try:
+                parsed = json.loads(content)
+                return _extract_file_list(parsed)
+            except (json.JSONDecodeError, TypeError):
+                pass
 
         # Extract JSON from ```json code blocks
         if "```" in content:
-            for block in content.split("```"):
+            for block in _fence_segments(content):
                 block = block.strip()
                 if block.startswith("json"):
                     block = block[4:].strip()
@@ -1015,14 +1423,16 @@ def _extract_file_list(content) -> list[dict]:
                     return recovered
 
         # Try XML <file path="...">...</file> tags
-        xml_files = _extract_xml_file_tags(content)
-        if xml_files:
-            return xml_files
+        if "<file" in content:
+            xml_files = _extract_xml_file_tags(content)
+            if xml_files:
+                return xml_files
 
         # Try shell heredoc patterns: cat > path << 'EOF'
-        heredoc_files = _extract_heredoc_files(content)
-        if heredoc_files:
-            return heredoc_files
+        if "<<" in content:
+            heredoc_files = _extract_heredoc_files(content)
+            if heredoc_files:
+                return heredoc_files
 
         # Try markdown code blocks with filename annotations
         md_files = _extract_markdown_file_blocks(content)
@@ -1037,6 +1447,60 @@ def _extract_file_list(content) -> list[dict]:
     return []
 
 
+# Whole-string JSON worth parsing starts with an object, array or string
+_JSON_START_RE = re.compile(r'\s*[{\["]')
+
+
+def _fence_segments(text: str):
+    """Yield the same pieces as text.split("```"), one at a time.
+
+    _extract_file_list usually returns from the first json block, so the
+    rest of a large artifact is never sliced."""
+    start = 0
+    while (end := text.find("```", start)) != -1:
+        yield text[start:end]
+        start = end + 3
+    yield text[start:]
+
+
+# Characters that change JSON nesting, and the rest of a string literal
+# after its opening quote (escapes included)
+_JSON_STRUCTURE_RE = re.compile(r'[{}\[\]"]')
+_JSON_STRING_TAIL_RE = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+
+
+def _scan_files_array(text: str, array_start: int):
+    """Yield (start, end) spans of the objects in the JSON array opening at
+    text[array_start].
+
+    One pass tracking bracket depth, jumping over string literals whole; an
+    object is yielded as soon as its closing brace is seen, so a truncated
+    final object is simply never yielded."""
+    depth = 0
+    obj_start = -1
+    pos = array_start
+    while m := _JSON_STRUCTURE_RE.search(text, pos):
+        i = m.start()
+        c = text[i]
+        pos = i + 1
+        if c == '"':
+            tail = _JSON_STRING_TAIL_RE.match(text, pos)
+            if tail is None:
+                return
+            pos = tail.end()
+        elif c == "{" or c == "[":
+            depth += 1
+            if depth == 2 and c == "{":
+                obj_start = i
+        else:
+            depth -= 1
+            if depth == 1 and obj_start != -1:
+                yield obj_start, pos
+                obj_start = -1
+            elif depth <= 0:
+                return
+
+
 def _recover_truncated_files(text: str) -> list[dict]:
     """Recover complete file entries from truncated JSON.
     LLM output often gets cut off mid-file. We extract all files
@@ -1064,8 +1528,8 @@ def _recover_truncated_files(text: str) -> list[dict]:
             except (json.JSONDecodeError, TypeError):
                 continue
 
-        # More aggressive recovery: binary search for the last valid truncation point
-        # Find where "files" array starts
+        # More aggressive recovery: scan the "files" array once for balanced
+        # objects and keep every one that parses, skipping malformed entries.
         files_start = text.find('"files"')
         if files_start == -1:
             return []
@@ -1073,20 +1537,19 @@ def _recover_truncated_files(text: str) -> list[dict]:
         if array_start == -1:
             return []
 
-        # Try progressively shorter substrings
-        for end in range(len(text), array_start, -100):
-            for suffix in ['"}]}', '"}\n]}']:
-                try:
-                    parsed = json.loads(text[:end] + suffix)
-                    result = parsed.get("files", []) if isinstance(parsed, dict) else parsed
-                    complete = [f for f in result if isinstance(f, dict)
-                                and f.get("path") and f.get("content")]
-                    if complete:
-                        console.print(f"  [yellow]Recovered {len(complete)} files from truncated JSON "
-                                      f"({len(text) - end} chars truncated)[/yellow]")
-                        return complete
-                except (json.JSONDecodeError, TypeError):
-                    continue
+        complete = []
+        end = array_start
+        for start, end in _scan_files_array(text, array_start):
+            try:
+                obj = json.loads(text[start:end])
+            except json.JSONDecodeError:
+                continue
+            if isinstance(obj, dict) and obj.get("path") and obj.get("content"):
+                complete.append(obj)
+        if complete:
+            _console().print(f"  [yellow]Recovered {len(complete)} files from truncated JSON "
+                          f"({len(text) - end} chars truncated)[/yellow]")
+            return complete
     except Exception:
         pass
     return []
@@ -1097,21 +1560,7 @@ def _make_tick_logger(logger: StreamLogger | None):
     if logger is None:
         return None
 
-    def on_tick(result):
-        logger.log("tick",
-                    tick=result.tick,
-                    actions=result.actions_taken,
-                    llm_calls=result.llm_calls,
-                    emitted=result.items_emitted,
-                    elapsed=round(result.elapsed_seconds, 3),
-                    routing_scheduled=result.propagations + result.rejected,
-                    routing_delivered=result.propagations,
-                    routing_rejected=result.rejected,
-                    critique_scores=result.critique_scores,
-                    critique_verdicts=result.critique_verdicts,
-                    rework_count=result.rework_count)
-
-    return on_tick
+    return logger.log_tick
 
 
 def _wrap_with_logger(invoke_fn, logger: StreamLogger | None):
@@ -1120,16 +1569,18 @@ def _wrap_with_logger(invoke_fn, logger: StreamLogger | None):
         return invoke_fn
 
     def logged_invoke(cell, action, work, neighbors):
+        # pos on both events pairs them up when calls within a tick overlap
+        pos = f"{cell.position[0]},{cell.position[1]}"
         logger.log("llm_start",
                     domain=cell.domain, agent=cell.agent_type,
                     role=cell.role, action=action.value,
-                    pos=f"{cell.position[0]},{cell.position[1]}",
-                    work_preview=str(work.content)[:300] if work else None)
+                    pos=pos,
+                    work_preview=_preview(work.content, 300) if work else None)
         result = invoke_fn(cell, action, work, neighbors)
         response_str = str(result) if result else ""
         logger.log("llm_end",
                     domain=cell.domain, agent=cell.agent_type,
-                    action=action.value,
+                    action=action.value, pos=pos,
                     token_count=len(response_str.split()),
                     response=response_str[:2000])
         return result
@@ -1144,32 +1595,39 @@ def _close_logger(logger: StreamLogger | None, result: RunResult, output_dir: st
                     artifacts=len(result.artifacts),
                     elapsed=result.elapsed_seconds)
         logger.close()
-        console.print(f"[green]Stream log: {os.path.join(output_dir, 'stream.jsonl')}[/green]")
+        _console().print(f"[green]Stream log: {os.path.join(output_dir, 'stream.jsonl')}[/green]")
 
 
 def _print_grid_info(grid: AgentGrid):
     """Print grid topology info."""
+    from rich.table import Table
+
     table = Table(title=f"Grid: {grid.width}x{grid.height} ({grid.neighborhood.value})")
     table.add_column("Domain", style="cyan")
     table.add_column("Cells", width=6)
     table.add_column("Types")
 
-    # Group by domain
-    domains: dict[str, list] = {}
+    # Group by domain, counting work in the same pass
+    cell_counts: Counter[str] = Counter()
+    types_by_domain: defaultdict[str, set[str]] = defaultdict(set)
+    work_count = 0
     for cell in grid.all_cells():
-        domains.setdefault(cell.domain, []).append(cell)
+        cell_counts[cell.domain] += 1
+        types_by_domain[cell.domain].add(cell.agent_type)
+        work_count += cell.has_work
 
-    for domain, cells in sorted(domains.items()):
-        types = sorted(set(c.agent_type for c in cells))
-        table.add_row(domain, str(len(cells)), ", ".join(types))
+    for domain, types in sorted(types_by_domain.items()):
+        table.add_row(domain, str(cell_counts[domain]), ", ".join(sorted(types)))
 
-    console.print(table)
-    console.print(f"  Total cells: {len(grid.cells)}")
-    console.print(f"  Cells with work: {sum(1 for c in grid.all_cells() if c.has_work)}")
+    _console().print(table)
+    _console().print(f"  Total cells: {len(grid.cells)}")
+    _console().print(f"  Cells with work: {work_count}")
 
 
 def _print_summary(result: RunResult, output_dir: str):
     """Print run summary."""
+    from rich.panel import Panel
+
     r = result.routing
     q = result.quality
     avg_q = q.avg_critique_score
@@ -1177,7 +1635,7 @@ def _print_summary(result: RunResult, output_dir: str):
     verdicts = q.verdict_counts
     verdict_str = ", ".join(f"{k}={v}" for k, v in sorted(verdicts.items())) if verdicts else "none"
 
-    console.print(Panel(
+    _console().print(Panel(
         f"Ticks: {result.total_ticks}\n"
         f"LLM calls: {result.total_llm_calls}\n"
         f"Items emitted: {result.total_items_emitted}\n"
@@ -1196,61 +1654,137 @@ def _print_summary(result: RunResult, output_dir: str):
     ))
 
     if result.artifacts:
-        console.print("\n[bold]Artifacts:[/bold]")
+        _console().print("\n[bold]Artifacts:[/bold]")
         for i, art in enumerate(result.artifacts):
             source = art.get("source", "?")
             kind = art.get("kind", "?")
             tick = art.get("tick", "?")
-            preview = str(art.get("content", ""))[:100]
-            console.print(f"  {i + 1}. [{source}] {kind} (tick {tick}): {preview}...")
+            preview = _preview(art.get("content", ""), 100)
+            _console().print(f"  {i + 1}. [{source}] {kind} (tick {tick}): {preview}...")
+
+
+# iterencode() (without _one_shot) uses the pure-Python generator, so a
+# preview can stop pulling chunks as soon as it has enough characters.
+_PREVIEW_ENCODER = json.JSONEncoder(default=str, ensure_ascii=False)
+
+
+def _preview(obj, n: int) -> str:
+    """First n characters of obj as text, without rendering all of a large dict/list."""
+    if isinstance(obj, str):
+        return obj[:n]
+    if isinstance(obj, (dict, list)):
+        chunks = []
+        size = 0
+        try:
+            for chunk in _PREVIEW_ENCODER.iterencode(obj):
+                chunks.append(chunk)
+                size += len(chunk)
+                if size >= n:
+                    break
+        except (TypeError, ValueError):
+            # Non-str keys or circular references; logging must not fail
+            return str(obj)[:n]
+        return "".join(chunks)[:n]
+    return str(obj)[:n]
+
+
+def _write_bytes(path: str, data: bytes):
+    """Create/truncate path and write data with raw os calls.
+
+    Skips the buffered file object (and its fstat/seek calls) that
+    Path.write_bytes builds, leaving open + write + close per file."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _write_json(path: str, obj):
+    """Write a JSON document (pretty-printed, non-serializable values as str).
+
+    Encoded in one shot with orjson when installed; stdlib json otherwise.
+    """
+    if orjson is not None:
+        data = orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        data = json.dumps(obj, indent=2, default=str).encode("utf-8")
+    _write_bytes(path, data)
+
+
+def _read_json(path: str):
+    """Read a JSON document written by _write_json in one shot.
+
+    Falls back to json when orjson rejects the input, e.g. the NaN/Infinity
+    literals json accepts in hand-written spec files."""
+    data = Path(path).read_bytes()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
 
 
 def _save_results(output_dir: str, grid: AgentGrid, result: RunResult, brief: str | None):
     """Save full run results to output directory."""
     # Grid snapshot
-    snapshot_path = os.path.join(output_dir, "grid-snapshot.json")
-    with open(snapshot_path, "w", encoding="utf-8") as f:
-        json.dump(grid.snapshot(), f, indent=2)
+    _write_json(os.path.join(output_dir, "grid-snapshot.json"), grid.snapshot())
 
     # Run result
-    result_path = os.path.join(output_dir, "run-result.json")
     result_data = {
         "brief": brief,
         "total_ticks": result.total_ticks,
         "total_llm_calls": result.total_llm_calls,
+        "total_cache_hits": result.total_cache_hits,
         "total_items_emitted": result.total_items_emitted,
         "quiescent": result.quiescent,
         "elapsed_seconds": result.elapsed_seconds,
         "artifacts_count": len(result.artifacts),
         # Two-level performance metrics (GRD-6)
-        "routing": result.routing.to_dict(result.all_routing_records),
+        "routing": result.routing.to_dict(),
         "quality": result.quality.to_dict(),
     }
-    with open(result_path, "w", encoding="utf-8") as f:
-        json.dump(result_data, f, indent=2)
+    _write_json(os.path.join(output_dir, "run-result.json"), result_data)
 
     # Artifacts (one file each)
     artifacts_dir = os.path.join(output_dir, "artifacts")
     os.makedirs(artifacts_dir, exist_ok=True)
-    for i, art in enumerate(result.artifacts):
-        art_path = os.path.join(artifacts_dir, f"artifact-{i:03d}.json")
-        with open(art_path, "w", encoding="utf-8") as f:
-            json.dump(art, f, indent=2, default=str)
+    if result.artifacts:
+        with ThreadPoolExecutor(max_workers=min(ARTIFACT_WRITE_WORKERS, len(result.artifacts))) as pool:
+            writes = [pool.submit(_write_json, os.path.join(artifacts_dir, f"artifact-{i:03d}.json"), art)
+                      for i, art in enumerate(result.artifacts)]
+        for fut in writes:
+            fut.result()
 
     # Tick history
-    history_path = os.path.join(output_dir, "tick-history.json")
-    with open(history_path, "w", encoding="utf-8") as f:
-        json.dump(
-            [{"tick": t.tick, "actions": t.actions_taken, "llm": t.llm_calls,
-              "emitted": t.items_emitted, "elapsed": t.elapsed_seconds,
-              "routing": {"scheduled": t.propagations + t.rejected,
-                          "delivered": t.propagations, "rejected": t.rejected},
-              "quality": {"critique_scores": t.critique_scores,
-                          "critique_verdicts": t.critique_verdicts,
-                          "rework_count": t.rework_count}}
-             for t in result.tick_history],
-            f, indent=2,
-        )
+    _write_tick_history(os.path.join(output_dir, "tick-history.json"), result.tick_history)
+
+
+def _write_tick_history(path: str, tick_history: list[TickResult]):
+    """Write tick history as a JSON array, one tick object per line.
+
+    Each tick is encoded and written as it is visited, so the full list of
+    per-tick dicts is never held in memory at once."""
+    encode = orjson.dumps if orjson is not None else (lambda obj: json.dumps(obj).encode("utf-8"))
+    with open(path, "wb") as f:
+        f.write(b"[")
+        sep = b"\n"
+        for t in tick_history:
+            f.write(sep)
+            f.write(encode(
+                {"tick": t.tick, "actions": t.actions_taken, "llm": t.llm_calls,
+                 "emitted": t.items_emitted, "elapsed": t.elapsed_seconds,
+                 "routing": {"scheduled": t.propagations + t.rejected,
+                             "delivered": t.propagations, "rejected": t.rejected},
+                 "quality": {"critique_scores": t.critique_scores,
+                             "critique_verdicts": t.critique_verdicts,
+                             "rework_count": t.rework_count}}
+            ))
+            sep = b",\n"
+        f.write(b"\n]\n")
 
 
 def _apply_best_rules(grid: AgentGrid):
@@ -1264,11 +1798,14 @@ def _apply_best_rules(grid: AgentGrid):
             cell.rule_table = best
             replaced += 1
     if replaced:
-        console.print(f"  [magenta]Replaced {replaced} cells with best-known rule tables[/magenta]")
+        _console().print(f"  [magenta]Replaced {replaced} cells with best-known rule tables[/magenta]")
 
 
 def _run_rule_search(args):
     """Run rule space search or evolutionary search."""
+    from rich.panel import Panel
+    from rich.table import Table
+
     from grids.orchestration.rule_search import RuleSearchHarness
 
     role = args.search_rules or args.evolve_rules
@@ -1276,7 +1813,7 @@ def _run_rule_search(args):
     harness = RuleSearchHarness()
 
     if args.evolve_rules:
-        console.print(Panel(
+        _console().print(Panel(
             f"Role: {role}\n"
             f"Generations: {args.rule_generations}\n"
             f"Population: {args.rule_population}\n"
@@ -1290,7 +1827,7 @@ def _run_rule_search(args):
             population=args.rule_population,
         )
     else:
-        console.print(Panel(
+        _console().print(Panel(
             f"Role: {role}\nBrief: {brief[:80]}",
             title="Rule Space Search (NKS Ch. 2-6)",
             border_style="cyan",
@@ -1318,21 +1855,21 @@ def _run_rule_search(args):
             c.fingerprint,
             f"[{style}]{delta_str}[/{style}]",
         )
-    console.print(table)
+    _console().print(table)
 
-    console.print(f"\n  Baseline score: {result.baseline_score:.1f}")
+    _console().print(f"\n  Baseline score: {result.baseline_score:.1f}")
     if result.best:
-        console.print(f"  Best score:     {result.best.score:.1f}")
-        console.print(f"  Improvement:    {result.best.score - result.baseline_score:+.1f}")
-    console.print(f"  Candidates tested: {result.candidates_tested}")
-    console.print(f"  Time: {result.elapsed_seconds:.1f}s")
+        _console().print(f"  Best score:     {result.best.score:.1f}")
+        _console().print(f"  Improvement:    {result.best.score - result.baseline_score:+.1f}")
+    _console().print(f"  Candidates tested: {result.candidates_tested}")
+    _console().print(f"  Time: {result.elapsed_seconds:.1f}s")
 
     # Show registry summary
     report = harness.report()
     if report:
-        console.print("\n[bold]Registry Summary:[/bold]")
+        _console().print("\n[bold]Registry Summary:[/bold]")
         for role_name, stats in sorted(report.items()):
-            console.print(
+            _console().print(
                 f"  {role_name}: {stats['tested']} tested, "
                 f"best={stats['best_score']:.1f}, avg={stats['avg_score']:.1f}"
             )
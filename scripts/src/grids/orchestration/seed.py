@@ -9,31 +9,116 @@ Seeds are YAML-configurable so you can explore the outcome space.
 
 from __future__ import annotations
 
-import copy
+import importlib.util
+import itertools
 import json
-import time
+from collections import OrderedDict
+from dataclasses import replace
+from functools import cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import yaml
 
-from grids.domain.config import DomainConfig, SubAgentConfig, load_domain
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from grids.domain.config import DomainConfig, SubAgentConfig, YamlLoader, load_domain
 from grids.orchestration.grid import AgentGrid, AgentCell, Neighborhood, WorkFragment
 from grids.orchestration.rules import generate_rule_table, AgentState
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
 
 DOMAINS_DIR = Path(__file__).resolve().parents[4] / "domains"
 
+# Suffix for seeded WorkFragment ids: unique within the process (wall-clock
+# seconds collided whenever several fragments were seeded in one second)
+_fragment_seq = itertools.count(1)
+
+RELEVANCE_MODEL = "all-MiniLM-L6-v2"
+# Brief queries (brief + domain) whose relevance scores are kept; enough for
+# every domain of a seed, so re-seeding the same brief skips re-encoding
+RELEVANCE_CACHE_BRIEFS = 32
+
+# Relevance filtering is optional; checked without importing the (heavy)
+# package, which is only loaded on first use by _get_relevance_model
+_HAS_SENTENCE_TRANSFORMERS = importlib.util.find_spec("sentence_transformers") is not None
+
+_relevance_model = None
+
+# brief query -> {sub-agent text: cosine similarity}, least recently used
+# first; rule search and repeated seeds re-filter with the same brief
+_relevance_cache: OrderedDict[str, dict[str, float]] = OrderedDict()
+
+
+def _get_relevance_model():
+    """Load the relevance-filter embedding model once per process.
+
+    Prefers the ONNX Runtime backend (faster CPU inference) when
+    optimum's onnxruntime support is installed and sentence-transformers
+    supports backend= (>=3.2); otherwise the default PyTorch backend."""
+    global _relevance_model
+    if _relevance_model is None:
+        from sentence_transformers import SentenceTransformer
+        model = None
+        if _has_onnx_backend():
+            try:
+                model = SentenceTransformer(RELEVANCE_MODEL, backend="onnx")
+            except Exception:
+                # Older sentence-transformers, a failed ONNX export, ... --
+                # any of these just means the PyTorch backend
+                model = None
+        _relevance_model = model or SentenceTransformer(RELEVANCE_MODEL)
+    return _relevance_model
+
+
+def _has_onnx_backend() -> bool:
+    """Whether backend="onnx" can load: it needs optimum.onnxruntime, not
+    just onnxruntime (which chromadb always installs)."""
+    try:
+        return importlib.util.find_spec("optimum.onnxruntime") is not None
+    except ModuleNotFoundError:
+        return False
+
+
+@cache
+def _console() -> Console:
+    from rich.console import Console
+    return Console(stderr=True)
+
+
+# path -> ((mtime_ns, size), parsed config or None if it failed to load)
+_domain_cache: dict[Path, tuple[tuple[int, int], DomainConfig | None]] = {}
+
 
 def load_available_domains() -> dict[str, DomainConfig]:
-    """Load all domain configs from the domains/ directory."""
+    """Load all domain configs from the domains/ directory.
+
+    Parsed configs are cached per file and reused until the file's mtime or
+    size changes. Callers get a fresh dict but shared DomainConfig objects,
+    which must not be mutated (filter_relevant_agents returns copies)."""
     configs = {}
     for path in sorted(DOMAINS_DIR.glob("*.yaml")):
         try:
-            cfg = load_domain(path)
-            configs[cfg.domain.name] = cfg
-        except Exception:
+            st = path.stat()
+        except OSError:
             continue
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = _domain_cache.get(path)
+        if cached is not None and cached[0] == stamp:
+            cfg = cached[1]
+        else:
+            try:
+                cfg = load_domain(path)
+            except Exception:
+                cfg = None
+            _domain_cache[path] = (stamp, cfg)
+        if cfg is not None:
+            configs[cfg.domain.name] = cfg
     return configs
 
 
@@ -45,61 +130,75 @@ def filter_relevant_agents(
     """Remove sub-agents whose aspect is irrelevant to the brief.
     Uses embedding cosine similarity for fast, cheap filtering.
     Agents below threshold are excluded from grid placement."""
-    if not brief or not config.sub_agents:
+    # At least 2 sub-agents are always kept (see below), so with 2 or fewer
+    # nothing can be filtered and the embedding work would be wasted
+    if not brief or len(config.sub_agents) <= 2:
+        return config
+    if np is None or not _HAS_SENTENCE_TRANSFORMERS:
         return config
 
     try:
-        from sentence_transformers import SentenceTransformer
-        import numpy as np
-
-        model = SentenceTransformer("all-MiniLM-L6-v2")
         # Use brief + domain context for better signal. Long briefs dilute similarity
         # so we also encode the domain description for cross-reference.
         domain_hint = config.domain.description[:200]
         brief_query = f"{brief[:800]}\n\nDomain: {domain_hint}"
-        brief_embedding = model.encode([brief_query])[0]
-
-        scored: list[tuple[SubAgentConfig, float]] = []
-
+        sa_texts = []
         for sa in config.sub_agents:
             concepts_str = ", ".join(sa.concepts[:10]) if sa.concepts else ""
-            sa_text = f"{sa.name}: {sa.aspect}. Concepts: {concepts_str}"
-            sa_embedding = model.encode([sa_text])[0]
-            similarity = float(np.dot(brief_embedding, sa_embedding) / (
-                np.linalg.norm(brief_embedding) * np.linalg.norm(sa_embedding)
-            ))
-            scored.append((sa, similarity))
-
-        # Sort by relevance descending
-        scored.sort(key=lambda x: x[1], reverse=True)
+            sa_texts.append(f"{sa.name}: {sa.aspect}. Concepts: {concepts_str}")
+
+        # Encode every sub-agent not already scored against this brief in one
+        # batch. The (long) brief is encoded on its own so the short
+        # sub-agent texts are only padded to the longest of themselves, not
+        # to the brief's length. Unit-norm embeddings make cosine similarity
+        # a plain dot product.
+        scores = _relevance_cache.get(brief_query)
+        if scores is None:
+            scores = _relevance_cache[brief_query] = {}
+            if len(_relevance_cache) > RELEVANCE_CACHE_BRIEFS:
+                _relevance_cache.popitem(last=False)
+        else:
+            _relevance_cache.move_to_end(brief_query)
+        missing = [t for t in sa_texts if t not in scores]
+        if missing:
+            model = _get_relevance_model()
+            brief_embedding = np.asarray(model.encode(brief_query,
+                                                      normalize_embeddings=True,
+                                                      show_progress_bar=False))
+            sa_embeddings = np.asarray(model.encode(missing,
+                                                    batch_size=min(32, len(missing)),
+                                                    normalize_embeddings=True,
+                                                    show_progress_bar=False))
+            for t, similarity in zip(missing, sa_embeddings @ brief_embedding):
+                scores[t] = float(similarity)
+
+        similarities = np.fromiter((scores[t] for t in sa_texts),
+                                   dtype=float, count=len(sa_texts))
+
+        # Rank by relevance descending (stable, so ties keep config order)
+        order = np.argsort(-similarities, kind="stable")
 
         # Always keep at least 2 sub-agents per domain (the seed explicitly
         # requested this domain, so gutting it defeats the purpose).
         # Beyond the minimum, apply the threshold.
-        min_keep = min(2, len(scored))
-        relevant: list[SubAgentConfig] = []
-        excluded: list[tuple[str, float]] = []
-
-        for i, (sa, similarity) in enumerate(scored):
-            if i < min_keep or similarity >= threshold:
-                relevant.append(sa)
-            else:
-                excluded.append((sa.name, similarity))
+        keep = similarities[order] >= threshold
+        keep[:2] = True
+        relevant: list[SubAgentConfig] = [config.sub_agents[i] for i in order[keep]]
+        excluded: list[tuple[str, float]] = [
+            (config.sub_agents[i].name, float(similarities[i])) for i in order[~keep]
+        ]
 
         if excluded:
-            from rich.console import Console
-            console = Console(stderr=True)
             domain_name = config.domain.name
             for name, score in excluded:
-                console.print(
+                _console().print(
                     f"  [dim]Filtered out {domain_name}/{name} "
                     f"(relevance={score:.2f} < {threshold})[/dim]"
                 )
 
-        # Return a modified copy -- don't mutate the original
-        filtered = copy.deepcopy(config)
-        filtered.sub_agents = relevant
-        return filtered
+        # Return a modified copy -- don't mutate the original. A shallow
+        # model_copy suffices: only the sub_agents list is replaced.
+        return config.model_copy(update={"sub_agents": relevant})
 
     except ImportError:
         return config
@@ -229,7 +328,7 @@ def seed_from_yaml(seed_path: str | Path) -> tuple[AgentGrid, dict]:
     """
     path = Path(seed_path)
     with open(path, "r", encoding="utf-8") as f:
-        seed_config = yaml.safe_load(f)
+        seed_config = yaml.load(f, Loader=YamlLoader)
 
     grid_cfg = seed_config.get("grid", {})
     domains = seed_config.get("domains", None)
@@ -259,7 +358,7 @@ def seed_from_yaml(seed_path: str | Path) -> tuple[AgentGrid, dict]:
     initial_work = seed_config.get("initial_work", [])
     for work_cfg in initial_work:
         fragment = WorkFragment(
-            id=f"seed-{int(time.time())}-{work_cfg.get('kind', 'brief')}",
+            id=f"seed-{next(_fragment_seq)}-{work_cfg.get('kind', 'brief')}",
             kind=work_cfg.get("kind", "brief_chunk"),
             content=work_cfg.get("content", ""),
             cost_of_delay=work_cfg.get("cost_of_delay", 1.0),
@@ -286,7 +385,7 @@ def seed_from_yaml(seed_path: str | Path) -> tuple[AgentGrid, dict]:
 def inject_brief(grid: AgentGrid, brief: str, cost_of_delay: float = 5.0):
     """Inject a brief into all master cells. The standard entry point."""
     fragment = WorkFragment(
-        id=f"brief-{int(time.time())}",
+        id=f"brief-{next(_fragment_seq)}",
         kind="brief_chunk",
         content=brief,
         cost_of_delay=cost_of_delay,
@@ -392,7 +491,7 @@ def seed_phase1b(
     }
 
     spec_fragment = WorkFragment(
-        id=f"phase1b-analysis-{int(time.time())}",
+        id=f"phase1b-analysis-{next(_fragment_seq)}",
         kind="brief_chunk",
         content=analysis_content_with_brief,
         cost_of_delay=5.0,
@@ -515,7 +614,7 @@ def seed_phase2(
                         "tone_and_voice": analysis_content.get("tone_and_voice", ""),
                     }
                 grid.inject(cell.position, WorkFragment(
-                    id=f"phase2-domain-context-{d}-{int(time.time())}",
+                    id=f"phase2-domain-context-{d}-{next(_fragment_seq)}",
                     kind="work_spec",
                     content=domain_context,
                     cost_of_delay=2.0,
@@ -524,23 +623,17 @@ def seed_phase2(
                 ))
 
     # Inject the consolidated spec into execution cells and master
-    spec_content = consolidated_spec if isinstance(consolidated_spec, str) else json.dumps(consolidated_spec, indent=2)
     spec_fragment = WorkFragment(
-        id=f"phase2-spec-{int(time.time())}",
+        id=f"phase2-spec-{next(_fragment_seq)}",
         kind="work_spec",
         content=consolidated_spec,
         cost_of_delay=5.0,
         job_size=3.0,
     )
 
-    # Master gets the spec to coordinate
-    grid.inject(master_cell.position, WorkFragment(
-        id=f"{spec_fragment.id}-master",
-        kind=spec_fragment.kind,
-        content=spec_fragment.content,
-        cost_of_delay=spec_fragment.cost_of_delay,
-        job_size=spec_fragment.job_size,
-    ))
+    # Master gets the spec to coordinate. Per-cell copies only differ in id
+    # (and the tester's content); the spec itself is shared by reference.
+    grid.inject(master_cell.position, replace(spec_fragment, id=f"{spec_fragment.id}-master"))
 
     # Extract acceptance criteria from the consolidated spec for the tester cell
     acceptance_criteria = []
@@ -549,19 +642,15 @@ def seed_phase2(
 
     # Each execution cell gets the spec (tester gets acceptance criteria injected)
     for cell in grid.cells_by_role("execution"):
-        content = spec_fragment.content
+        content = consolidated_spec
         if cell.agent_type == "tester" and acceptance_criteria:
             # Wrap spec + criteria so the tester sees both
             content = {
                 "spec": consolidated_spec,
                 "acceptance_criteria": acceptance_criteria,
             }
-        grid.inject(cell.position, WorkFragment(
-            id=f"{spec_fragment.id}-{cell.agent_type}",
-            kind=spec_fragment.kind,
-            content=content,
-            cost_of_delay=spec_fragment.cost_of_delay,
-            job_size=spec_fragment.job_size,
+        grid.inject(cell.position, replace(
+            spec_fragment, id=f"{spec_fragment.id}-{cell.agent_type}", content=content,
         ))
 
     return grid
@@ -626,18 +715,17 @@ def _place_domain_column(grid: AgentGrid, col: int, config: DomainConfig):
     )
     grid.place(master_cell)
 
+    # Sub-agents also search this domain's web collection. Collections are
+    # only read, so every sub-agent in the column shares one list.
+    web_coll = f"{domain_name}-web"
+    sa_collections = collections if web_coll in collections else [*collections, web_coll]
+
     # Rows 1+: sub-agents
     for i, sa in enumerate(config.sub_agents):
         row = i + 1
         if row >= grid.height:
             break
 
-        sa_collections = list(collections)
-        # Add web collection for this domain
-        web_coll = f"{domain_name}-web"
-        if web_coll not in sa_collections:
-            sa_collections.append(web_coll)
-
         cell = AgentCell(
             position=(col, row),
             domain=domain_name,
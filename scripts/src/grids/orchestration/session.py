@@ -17,6 +17,11 @@ import os
 import sys
 import time
 
+try:
+    import orjson
+except ImportError:  # optional: faster session.json serialization
+    orjson = None
+
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress
@@ -108,8 +113,14 @@ def run_session(
     }
 
     result_path = os.path.join(output_dir, "session.json")
-    with open(result_path, "w", encoding="utf-8") as f:
-        json.dump(result, f, indent=2)
+    # Encode first (orjson when installed), then write once: json.dump would
+    # issue a write per encoder chunk through the 8 KiB default buffer
+    if orjson is not None:
+        data = orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        data = json.dumps(result, indent=2).encode("utf-8")
+    with open(result_path, "wb") as f:
+        f.write(data)
 
     if verbose:
         console.print(f"  Saved: {result_path}")
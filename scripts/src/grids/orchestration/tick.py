@@ -13,7 +13,10 @@ execution is delegated to an invoke_fn callback.
 from __future__ import annotations
 
 import time
-from dataclasses import dataclass, field
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from typing import Any, Callable
 
 from rich.console import Console
@@ -23,6 +26,12 @@ from grids.orchestration.rules import AgentState, Signal, Action, RuleEntry
 
 console = Console(stderr=True)
 
+# Enum class attribute lookups are slow next to a module global; tick()'s
+# per-cell loops use these. Members are singletons, so `is` is exact.
+_IDLE = AgentState.IDLE
+_INSUFFICIENT_COVERAGE = Signal.INSUFFICIENT_COVERAGE
+_SKIP_ACTIONS = frozenset({Action.WAIT, Action.SKIP})
+
 
 @dataclass
 class PropagationRecord:
@@ -53,6 +62,7 @@ class TickResult:
     critique_scores: list[float] = field(default_factory=list)
     critique_verdicts: list[str] = field(default_factory=list)
     rework_count: int = 0
+    cache_hits: int = 0  # invoke_fn calls answered from cache (not in llm_calls)
 
 
 @dataclass
@@ -61,6 +71,8 @@ class RoutingMetrics:
     items_scheduled: int = 0
     items_delivered: int = 0
     items_rejected: int = 0
+    # Per target role: {"scheduled", "delivered", "rejected"}, filled by add_records
+    by_target: dict[str, dict[str, int]] = field(default_factory=dict)
 
     @property
     def routing_efficiency(self) -> float:
@@ -68,19 +80,33 @@ class RoutingMetrics:
             return 0.0
         return self.items_delivered / self.items_scheduled
 
-    def per_role_breakdown(self, records: list[PropagationRecord]) -> dict[str, dict]:
-        """What % of items reached each role type."""
-        by_target: dict[str, dict] = {}
+    def add_records(self, records: list[PropagationRecord]):
+        """Fold routing records into the per-role counts."""
+        by_target = self.by_target
         for r in records:
-            entry = by_target.setdefault(r.target_role, {"scheduled": 0, "delivered": 0, "rejected": 0})
+            entry = by_target.get(r.target_role)
+            if entry is None:
+                entry = by_target[r.target_role] = {"scheduled": 0, "delivered": 0, "rejected": 0}
             entry["scheduled"] += 1
             if r.accepted:
                 entry["delivered"] += 1
             else:
                 entry["rejected"] += 1
-        for entry in by_target.values():
-            entry["efficiency"] = round(entry["delivered"] / entry["scheduled"], 3) if entry["scheduled"] else 0.0
-        return by_target
+
+    def per_role_breakdown(self, records: list[PropagationRecord] | None = None) -> dict[str, dict]:
+        """What % of items reached each role type.
+
+        Uses the counts accumulated by add_records unless records is given."""
+        if records is None:
+            by_target = self.by_target
+        else:
+            tally = RoutingMetrics()
+            tally.add_records(records)
+            by_target = tally.by_target
+        return {
+            role: {**entry, "efficiency": round(entry["delivered"] / entry["scheduled"], 3) if entry["scheduled"] else 0.0}
+            for role, entry in by_target.items()
+        }
 
     def to_dict(self, records: list[PropagationRecord] | None = None) -> dict:
         d = {
@@ -91,6 +117,8 @@ class RoutingMetrics:
         }
         if records:
             d["per_role_breakdown"] = self.per_role_breakdown(records)
+        elif self.by_target:
+            d["per_role_breakdown"] = self.per_role_breakdown()
         return d
 
 
@@ -98,7 +126,7 @@ class RoutingMetrics:
 class QualityMetrics:
     """Metric 2: Cell output quality -- did cells produce good output?"""
     critique_scores: list[float] = field(default_factory=list)
-    critique_verdicts: list[str] = field(default_factory=list)
+    critique_verdicts: Counter[str] = field(default_factory=Counter)
     rework_count: int = 0
 
     @property
@@ -109,10 +137,7 @@ class QualityMetrics:
 
     @property
     def verdict_counts(self) -> dict[str, int]:
-        counts: dict[str, int] = {}
-        for v in self.critique_verdicts:
-            counts[v] = counts.get(v, 0) + 1
-        return counts
+        return dict(self.critique_verdicts)
 
     def to_dict(self) -> dict:
         avg = self.avg_critique_score
@@ -130,6 +155,7 @@ class RunResult:
     total_ticks: int
     total_llm_calls: int
     total_items_emitted: int
+    total_cache_hits: int = 0
     artifacts: list[dict] = field(default_factory=list)
     tick_history: list[TickResult] = field(default_factory=list)
     quiescent: bool = False
@@ -145,19 +171,28 @@ class RunResult:
 InvokeFn = Callable[[AgentCell, Action, WorkFragment | None, list[CellOutput]], Any]
 
 
-def tick(grid: AgentGrid, invoke_fn: InvokeFn) -> TickResult:
+def tick(grid: AgentGrid, invoke_fn: InvokeFn, max_workers: int = 1) -> TickResult:
     """Execute one tick of the cellular automaton.
 
     Phase 1 (READ):    All cells snapshot neighbor states and detect signals
     Phase 2 (COMPUTE): All cells apply rule tables to determine actions
     Phase 3 (EXECUTE): All cells execute their action (may invoke LLM)
     Phase 4 (PROPAGATE): All outputs delivered to neighbor inboxes
+
+    With max_workers > 1, Phase 3 collects the tick's invoke_fn calls and
+    runs them together, up to max_workers at a time. Calls only see the
+    Phase 1 neighbor snapshot, and their results are emitted afterwards in
+    cell order, interleaved with the propagations neighbor moves scheduled
+    in between, so Phase 4 delivers exactly as the sequential path does.
     """
-    t0 = time.time()
+    t0 = time.perf_counter_ns()
     grid.tick_count += 1
     tick_num = grid.tick_count
 
     cells = grid.all_cells()
+    # Long-range broadcast targets, looked up once per tick rather than per emission
+    exec_cells = grid.cells_by_role("execution")
+    consultants = [c for c in grid.cells_by_role("sub") if c.agent_type == "consultant"]
     actions_taken = 0
     llm_calls = 0
     items_emitted = 0
@@ -165,27 +200,23 @@ def tick(grid: AgentGrid, invoke_fn: InvokeFn) -> TickResult:
     cell_actions = []
 
     # Phase 1: READ -- snapshot all neighbor states
-    cell_signals: dict[tuple[int, int], Signal] = {}
-    cell_neighbor_outputs: dict[tuple[int, int], list[CellOutput]] = {}
-
+    # Phase 2: COMPUTE -- all cells apply rules
+    # Done in one pass: a cell's signal depends on its own fields and its
+    # neighbors' CellOutput snapshots, and apply_rule only changes the cell's
+    # own state, so no cell sees another's Phase 2 result early.
+    # plan holds (cell, neighbor outputs, rule) in cell order for Phase 3.
+    plan: list[tuple[AgentCell, list[CellOutput], RuleEntry | None]] = []
     for cell in cells:
         neighbor_outs = grid.neighbor_outputs(cell.position)
-        cell_neighbor_outputs[cell.position] = neighbor_outs
         signal = cell.detect_signal(neighbor_outs)
-        cell_signals[cell.position] = signal
-
-    # Phase 2: COMPUTE -- all cells apply rules
-    cell_rules: dict[tuple[int, int], RuleEntry | None] = {}
-    for cell in cells:
-        signal = cell_signals[cell.position]
         rule = cell.apply_rule(signal)
-        cell_rules[cell.position] = rule
+        plan.append((cell, neighbor_outs, rule))
 
         # Stuck-cell detection: inbox has items but no rule matched.
         # Exclude execution cells waiting on domain coverage (legitimate wait).
         legitimately_waiting = (
             cell.role == "execution"
-            and signal == Signal.INSUFFICIENT_COVERAGE
+            and signal is _INSUFFICIENT_COVERAGE
         )
         if cell.has_work and rule is None and not legitimately_waiting:
             cell.ticks_with_unprocessed += 1
@@ -200,24 +231,31 @@ def tick(grid: AgentGrid, invoke_fn: InvokeFn) -> TickResult:
         else:
             cell.ticks_with_unprocessed = 0
 
-    # Phase 3: EXECUTE -- all cells act
-    for cell in cells:
+    # Phase 3: EXECUTE -- all cells act. With max_workers > 1, LLM calls are
+    # queued as (cell, action, consumed, neighbors, cell_actions entry) and
+    # run below; scheduled_before[i] holds the propagations scheduled (by
+    # neighbor moves) between call i-1 and call i.
+    calls: list[tuple[AgentCell, Action, WorkFragment | None, list[CellOutput], dict]] = []
+    scheduled_before: list[list[tuple[tuple[int, int], WorkFragment]]] = []
+    critiques: list[Any] = []
+    # A cached invoke_fn (see llm_cache) bumps cell.cache_hits instead of
+    # calling the LLM; those calls are moved out of llm_calls below.
+    hits_before = [c.cache_hits for c in cells]
+    for cell, neighbors, rule in plan:
         cell.ticks_active += 1
 
         # Class 4: track consecutive idle ticks for STALE detection
-        if cell.state == AgentState.IDLE and not cell.has_work:
+        if cell.state is _IDLE and not cell.has_work:
             cell.ticks_idle_consecutive += 1
         else:
             cell.ticks_idle_consecutive = 0
 
-        rule = cell_rules[cell.position]
-
         if rule is None:
             continue
 
         action = rule.action
 
-        if action in (Action.WAIT, Action.SKIP):
+        if action in _SKIP_ACTIONS:
             cell_actions.append({
                 "pos": cell.position, "action": action.value, "skipped": True,
             })
@@ -226,94 +264,23 @@ def tick(grid: AgentGrid, invoke_fn: InvokeFn) -> TickResult:
         actions_taken += 1
         work = cell.peek_inbox()
 
-        if action == Action.SPLIT_BATCH and len(cell.inbox) > 1:
-            # Share work with an idle neighbor
-            _split_to_neighbor(cell, grid, tick_num)
-            cell_actions.append({
-                "pos": cell.position, "action": "split_batch",
-            })
-            continue
-
-        if action == Action.PULL:
-            # Try to pull work from a busy neighbor
-            _pull_from_neighbor(cell, grid)
-            cell_actions.append({
-                "pos": cell.position, "action": "pull",
-            })
-            continue
-
-        if action == Action.ESCALATE:
-            # Send current work to a critique/master neighbor
-            if work:
-                _escalate_to_neighbor(cell, grid, tick_num)
-            cell_actions.append({
-                "pos": cell.position, "action": "escalate",
-            })
-            continue
-
-        if action == Action.PATCH:
-            # Patch existing artifact with late-arriving enrichment
-            if work is None:
+        move = _NEIGHBOR_ACTIONS.get(action)
+        if move is not None:
+            if action == Action.SPLIT_BATCH and len(cell.inbox) <= 1:
                 continue
-            consumed = cell.pop_inbox()
-            neighbors = cell_neighbor_outputs[cell.position]
-            cell.llm_calls += 1
-            llm_calls += 1
-            result = invoke_fn(cell, action, consumed, neighbors)
-            if result is not None:
-                cell.emit(result, "artifact", tick_num)
-                items_emitted += 1
-                _propagate_output(cell, grid, result, "artifact", tick_num)
+            move(cell, grid, tick_num)
             cell_actions.append({
-                "pos": cell.position, "action": "patch",
-                "domain": cell.domain, "agent": cell.agent_type,
-                "consumed": consumed.kind if consumed else None,
-                "emitted": "artifact" if result else None,
+                "pos": cell.position, "action": action.value,
             })
             continue
 
-        if action == Action.CHALLENGE:
-            # Class 4 perturbation: critique cell injects a "what's missing?" challenge
-            neighbors = cell_neighbor_outputs[cell.position]
-            cell.llm_calls += 1
-            llm_calls += 1
-            result = invoke_fn(cell, action, None, neighbors)
-            if result is not None:
-                cell.emit(result, "challenge", tick_num)
-                items_emitted += 1
-                _propagate_output(cell, grid, result, "challenge", tick_num)
-            cell_actions.append({
-                "pos": cell.position, "action": "challenge",
-                "domain": cell.domain, "agent": cell.agent_type,
-                "emitted": "challenge" if result else None,
-            })
+        consumes = _QUEUED_ACTIONS.get(action)
+        if consumes is None:
             continue
-
-        if action == Action.GAP_ANALYSIS:
-            # Class 4 perturbation: analyze gaps between brief and produced artifacts
-            neighbors = cell_neighbor_outputs[cell.position]
-            cell.llm_calls += 1
-            llm_calls += 1
-            result = invoke_fn(cell, action, None, neighbors)
-            if result is not None:
-                kind = "enrichment" if cell.role == "research" else "work_spec"
-                cell.emit(result, kind, tick_num)
-                items_emitted += 1
-                _propagate_output(cell, grid, result, kind, tick_num)
-            cell_actions.append({
-                "pos": cell.position, "action": "gap_analysis",
-                "domain": cell.domain, "agent": cell.agent_type,
-                "emitted": kind if result else None,
-            })
-            continue
-
-        if action in (Action.PROCESS, Action.CRITIQUE, Action.EMIT):
-            if work is None and action != Action.EMIT:
-                continue
-
+        if consumes and work is None:
             # EMIT with empty inbox: just transition state, no LLM call needed.
             # The cell already has output from its previous PROCESS action.
-            if action == Action.EMIT and work is None:
+            if action == Action.EMIT:
                 cell_actions.append({
                     "pos": cell.position,
                     "action": action.value,
@@ -322,55 +289,76 @@ def tick(grid: AgentGrid, invoke_fn: InvokeFn) -> TickResult:
                     "consumed": None,
                     "emitted": None,
                 })
-                continue
-
-            consumed = cell.pop_inbox() if work else None
-            neighbors = cell_neighbor_outputs[cell.position]
-
-            # Invoke the actual execution (LLM call or local computation)
-            cell.llm_calls += 1
-            llm_calls += 1
-            result = invoke_fn(cell, action, consumed, neighbors)
-
-            if result is not None:
-                # Emit output
-                kind = _output_kind(cell, action, consumed)
-                cell.emit(result, kind, tick_num)
-                items_emitted += 1
+            continue
 
-                # Propagate to neighbors' inboxes
-                _propagate_output(cell, grid, result, kind, tick_num)
+        # Queue the actual execution (LLM call or local computation)
+        cell.llm_calls += 1
+        llm_calls += 1
+        entry = {
+            "pos": cell.position,
+            "action": action.value,
+            "domain": cell.domain,
+            "agent": cell.agent_type,
+        }
+        consumed = None
+        if consumes:
+            consumed = cell.pop_inbox()
+            entry["consumed"] = consumed.kind
+        entry["emitted"] = None
+        cell_actions.append(entry)
+        if max_workers > 1:
+            scheduled_before.append(grid.take_propagations())
+            calls.append((cell, action, consumed, neighbors, entry))
+            continue
 
-            cell_actions.append({
-                "pos": cell.position,
-                "action": action.value,
-                "domain": cell.domain,
-                "agent": cell.agent_type,
-                "consumed": consumed.kind if consumed else None,
-                "emitted": kind if result else None,
-            })
+        result = invoke_fn(cell, action, consumed, neighbors)
+        if result is not None:
+            kind = _emit_result(cell, grid, action, consumed, entry, result, tick_num, exec_cells, consultants)
+            items_emitted += 1
+            if kind == "critique":
+                critiques.append(result)
+
+    if calls:
+        scheduled_after = grid.take_propagations()
+        results = _invoke_all(invoke_fn, calls, max_workers)
+        for (cell, action, consumed, _, entry), result, scheduled in zip(calls, results, scheduled_before):
+            grid.schedule_propagations(scheduled)
+            if result is None:
+                continue
+            kind = _emit_result(cell, grid, action, consumed, entry, result, tick_num, exec_cells, consultants)
+            items_emitted += 1
+            if kind == "critique":
+                critiques.append(result)
+        grid.schedule_propagations(scheduled_after)
+
+    cache_hits = 0
+    for cell, before in zip(cells, hits_before):
+        if cell.cache_hits != before:
+            cell.llm_calls -= cell.cache_hits - before
+            cache_hits += cell.cache_hits - before
+    llm_calls -= cache_hits
 
     # Phase 4: PROPAGATE -- deliver all pending fragments
     delivered, rejected, routing_records = grid.flush_propagations_detailed()
 
-    # Collect critique scores and rework counts from this tick's actions
+    # Collect critique scores and rework counts from this tick's actions.
+    # Each cell emits at most once per tick, so these are the critiques
+    # emitted above, already in cell order.
     tick_critique_scores: list[float] = []
     tick_critique_verdicts: list[str] = []
     tick_rework_count = 0
-    for cell in cells:
-        if cell.output.tick == tick_num and cell.output.kind == "critique":
-            content = cell.output.content
-            if isinstance(content, dict):
-                score = content.get("score")
-                verdict = content.get("verdict")
-                if isinstance(score, (int, float)):
-                    tick_critique_scores.append(float(score))
-                if isinstance(verdict, str) and verdict:
-                    tick_critique_verdicts.append(verdict)
-                if verdict in ("fail", "iterate"):
-                    tick_rework_count += 1
-
-    elapsed = time.time() - t0
+    for content in critiques:
+        if isinstance(content, dict):
+            score = content.get("score")
+            verdict = content.get("verdict")
+            if isinstance(score, (int, float)):
+                tick_critique_scores.append(float(score))
+            if isinstance(verdict, str) and verdict:
+                tick_critique_verdicts.append(verdict)
+            if verdict in ("fail", "iterate"):
+                tick_rework_count += 1
+
+    elapsed = (time.perf_counter_ns() - t0) / 1e9
     return TickResult(
         tick=tick_num,
         actions_taken=actions_taken,
@@ -385,6 +373,7 @@ def tick(grid: AgentGrid, invoke_fn: InvokeFn) -> TickResult:
         critique_scores=tick_critique_scores,
         critique_verdicts=tick_critique_verdicts,
         rework_count=tick_rework_count,
+        cache_hits=cache_hits,
     )
 
 
@@ -395,15 +384,18 @@ def run(
     quiescence_ticks: int = 3,
     verbose: bool = True,
     on_tick: Callable[[TickResult], None] | None = None,
+    max_workers: int = 1,
 ) -> RunResult:
     """Run the grid until quiescence or max ticks.
 
     Quiescence = all cells idle with empty inboxes for `quiescence_ticks` consecutive ticks.
+    max_workers bounds concurrent invoke_fn calls within a tick (1 = sequential).
     """
-    t0 = time.time()
+    t0 = time.perf_counter_ns()
     total_llm = 0
     total_emitted = 0
-    artifacts: list[dict] = []
+    total_cache_hits = 0
+    artifacts_by_pos: dict[tuple[int, int], dict] = {}
     tick_history: list[TickResult] = []
     idle_streak = 0
 
@@ -413,19 +405,21 @@ def run(
     all_routing_records: list[PropagationRecord] = []
 
     for i in range(max_ticks):
-        result = tick(grid, invoke_fn)
+        result = tick(grid, invoke_fn, max_workers)
         tick_history.append(result)
         total_llm += result.llm_calls
         total_emitted += result.items_emitted
+        total_cache_hits += result.cache_hits
 
         # Accumulate two-level metrics
         routing.items_scheduled += result.propagations + result.rejected
         routing.items_delivered += result.propagations
         routing.items_rejected += result.rejected
+        routing.add_records(result.routing_records)
         all_routing_records.extend(result.routing_records)
 
         quality.critique_scores.extend(result.critique_scores)
-        quality.critique_verdicts.extend(result.critique_verdicts)
+        quality.critique_verdicts.update(result.critique_verdicts)
         quality.rework_count += result.rework_count
 
         if verbose:
@@ -448,14 +442,8 @@ def run(
                     "kind": cell.output.kind,
                 }
                 # Replace any earlier artifact from the same cell position
-                replaced = False
-                for idx, existing in enumerate(artifacts):
-                    if existing["position"] == cell.position:
-                        artifacts[idx] = entry
-                        replaced = True
-                        break
-                if not replaced:
-                    artifacts.append(entry)
+                # (keeps its original place in the order)
+                artifacts_by_pos[cell.position] = entry
 
         # Check quiescence
         if grid.is_quiescent() and not grid.has_pending_work():
@@ -471,10 +459,11 @@ def run(
         total_ticks=grid.tick_count,
         total_llm_calls=total_llm,
         total_items_emitted=total_emitted,
-        artifacts=artifacts,
+        total_cache_hits=total_cache_hits,
+        artifacts=list(artifacts_by_pos.values()),
         tick_history=tick_history,
         quiescent=grid.is_quiescent(),
-        elapsed_seconds=round(time.time() - t0, 2),
+        elapsed_seconds=round((time.perf_counter_ns() - t0) / 1e9, 2),
         routing=routing,
         quality=quality,
         all_routing_records=all_routing_records,
@@ -483,22 +472,74 @@ def run(
 
 # --- Internal helpers ---
 
+def _invoke_all(
+    invoke_fn: InvokeFn,
+    calls: list[tuple[AgentCell, Action, WorkFragment | None, list[CellOutput], dict]],
+    max_workers: int,
+) -> list[Any]:
+    """Run a tick's queued invoke_fn calls, returning results in call order."""
+    if max_workers <= 1 or len(calls) <= 1:
+        return [invoke_fn(cell, action, work, neighbors) for cell, action, work, neighbors, _ in calls]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(calls)),
+                            thread_name_prefix="grids-invoke") as pool:
+        futures = [pool.submit(invoke_fn, cell, action, work, neighbors)
+                   for cell, action, work, neighbors, _ in calls]
+        return [f.result() for f in futures]
+
+
+def _emit_result(
+    cell: AgentCell,
+    grid: AgentGrid,
+    action: Action,
+    consumed: WorkFragment | None,
+    entry: dict,
+    result: Any,
+    tick_num: int,
+    exec_cells: list[AgentCell],
+    consultants: list[AgentCell],
+) -> str:
+    """Emit an invoke_fn result and propagate it to neighbors' inboxes.
+    Returns the output kind."""
+    kind = _result_kind(cell, action, consumed)
+    cell.emit(result, kind, tick_num)
+    entry["emitted"] = kind
+    _propagate_output(cell, grid, result, kind, tick_num, exec_cells, consultants)
+    return kind
+
+
+def _result_kind(cell: AgentCell, action: Action, consumed: WorkFragment | None) -> str:
+    """Output kind for an invoke_fn result, by the action that produced it."""
+    if action == Action.PATCH:
+        return "artifact"
+    if action == Action.CHALLENGE:
+        return "challenge"
+    if action == Action.GAP_ANALYSIS:
+        return "enrichment" if cell.role == "research" else "work_spec"
+    return _output_kind(cell, action, consumed)
+
+
 def _output_kind(cell: AgentCell, action: Action, consumed: WorkFragment | None) -> str:
     """Determine the kind of output based on cell role and action."""
+    return _kind_for(cell.role, cell.agent_type, action, consumed.kind if consumed is not None else None)
+
+
+@lru_cache(maxsize=256)
+def _kind_for(role: str, agent_type: str, action: Action, consumed_kind: str | None) -> str:
+    """_output_kind by value; the inputs come from a small fixed vocabulary."""
     if action == Action.CRITIQUE:
         return "critique"
-    if cell.role == "master" and action == Action.PROCESS:
+    if role == "master" and action == Action.PROCESS:
         return "work_spec"
-    if cell.role == "execution":
+    if role == "execution":
         return "artifact"
-    if cell.role == "research":
+    if role == "research":
         return "research"
     # Consultant reviewing an artifact emits enrichment (triggers long-range broadcast
     # back to execution cells and PATCH action on arrival)
-    if cell.agent_type == "consultant" and consumed and consumed.kind in ("artifact", "code"):
+    if agent_type == "consultant" and consumed_kind in ("artifact", "code"):
         return "enrichment"
-    if consumed:
-        return consumed.kind
+    if consumed_kind is not None:
+        return consumed_kind
     return "output"
 
 
@@ -508,6 +549,8 @@ def _propagate_output(
     content: Any,
     kind: str,
     tick_num: int,
+    exec_cells: list[AgentCell] | None = None,
+    consultants: list[AgentCell] | None = None,
 ):
     """Propagate a cell's output to its neighbors' inboxes for the NEXT tick.
     Critique FAILs trigger rework propagation back to the source cell.
@@ -516,78 +559,81 @@ def _propagate_output(
     are also sent directly to execution cells, bypassing hop-by-hop propagation.
     This ensures execution cells receive domain knowledge even when physically
     distant on the grid.
-    """
-    neighbor_positions = grid.neighbor_positions(cell.position)
-    fragment = WorkFragment(
-        id=f"t{tick_num}-{cell.position[0]},{cell.position[1]}-{kind}",
-        kind=kind,
-        content=content,
-        source_cell=cell.position,
-        cost_of_delay=1.0,
-        job_size=1.0,
-    )
-
-    # Track which positions we've already scheduled to avoid duplicates
-    scheduled_positions = set()
-
-    for npos in neighbor_positions:
-        neighbor = grid.get(npos)
-        if neighbor is None:
-            continue
-        if neighbor.position == cell.position:
-            continue
-        if _should_receive(neighbor, kind, cell):
-            grid.schedule_propagation(npos, WorkFragment(
-                id=f"{fragment.id}->{npos[0]},{npos[1]}",
-                kind=fragment.kind,
-                content=fragment.content,
-                source_cell=cell.position,
-                cost_of_delay=fragment.cost_of_delay,
-                job_size=fragment.job_size,
-                tags={"from_domain": cell.domain, "from_agent": cell.agent_type},
-            ))
-            scheduled_positions.add(npos)
 
+    exec_cells / consultants are the broadcast targets; tick() passes them in
+    so they are looked up once per tick. Omitted, they are read from the grid.
+    """
+    receivers = grid.receiving_neighbors(cell.position, kind, _should_receive)
     # Long-range broadcast: masters and research send work_specs/enrichment
     # directly to ALL execution cells, regardless of grid distance.
     # This solves the "execution starved" problem where domain output
     # can't reach execution cells through hop-by-hop propagation alone.
-    if kind in ("work_spec", "enrichment", "research", "concept") and cell.role in ("master", "research", "sub"):
-        for exec_cell in grid.cells_by_role("execution"):
-            if exec_cell.position in scheduled_positions:
-                continue
-            if exec_cell.position == cell.position:
-                continue
-            grid.schedule_propagation(exec_cell.position, WorkFragment(
-                id=f"{fragment.id}->exec-{exec_cell.position[0]},{exec_cell.position[1]}",
-                kind=fragment.kind,
-                content=fragment.content,
-                source_cell=cell.position,
-                cost_of_delay=fragment.cost_of_delay,
-                job_size=fragment.job_size,
-                tags={"from_domain": cell.domain, "from_agent": cell.agent_type, "broadcast": "true"},
-            ))
-
+    to_execution = (kind in ("work_spec", "enrichment", "research", "concept")
+                    and cell.role in ("master", "research", "sub"))
     # Long-range broadcast: execution artifacts are sent directly to consultant
     # cells for domain-specific review. Consultant enrichment flows back to
     # execution cells via the existing enrichment broadcast path.
-    if kind in ("artifact", "code") and cell.role == "execution":
-        for consultant in grid.cells_by_role("sub"):
-            if consultant.agent_type != "consultant":
-                continue
-            if consultant.position in scheduled_positions:
-                continue
-            if consultant.position == cell.position:
-                continue
-            grid.schedule_propagation(consultant.position, WorkFragment(
-                id=f"{fragment.id}->consult-{consultant.position[0]},{consultant.position[1]}",
-                kind=fragment.kind,
-                content=fragment.content,
-                source_cell=cell.position,
-                cost_of_delay=fragment.cost_of_delay,
-                job_size=fragment.job_size,
-                tags={"from_domain": cell.domain, "from_agent": cell.agent_type, "review_requested": "true"},
-            ))
+    to_consultants = kind in ("artifact", "code") and cell.role == "execution"
+
+    # Nothing to deliver (e.g. a critique with no accepting neighbor): skip
+    # building the fragment and go straight to the rework check.
+    if receivers or to_execution or to_consultants:
+        # Per-target copies differ only in id and tags
+        fragment = WorkFragment(
+            id=f"t{tick_num}-{cell.position[0]},{cell.position[1]}-{kind}",
+            kind=kind,
+            content=content,
+            source_cell=cell.position,
+            cost_of_delay=1.0,
+            job_size=1.0,
+        )
+        # Shared by every copy of this output that carries the same tags
+        origin = {"from_domain": cell.domain, "from_agent": cell.agent_type}
+
+        pending: list[tuple[tuple[int, int], WorkFragment]] = [
+            (npos, replace(fragment, id=f"{fragment.id}->{npos[0]},{npos[1]}", tags=origin))
+            for npos in receivers
+        ]
+
+        # Broadcasts skip positions the neighbor pass already covered. The two
+        # broadcast kinds are disjoint, so at most one branch runs.
+        if to_execution:
+            if exec_cells is None:
+                exec_cells = grid.cells_by_role("execution")
+            # Small grids: the neighbor pass may already reach every execution
+            # cell (the source is never one itself here), leaving nothing to send.
+            covered = sum(1 for npos in receivers if grid.cells[npos].role == "execution")
+            if covered < len(exec_cells):
+                scheduled_positions = frozenset(receivers)
+                broadcast_tags = {**origin, "broadcast": "true"}
+                for exec_cell in exec_cells:
+                    if exec_cell.position in scheduled_positions:
+                        continue
+                    if exec_cell.position == cell.position:
+                        continue
+                    pending.append((exec_cell.position, replace(
+                        fragment,
+                        id=f"{fragment.id}->exec-{exec_cell.position[0]},{exec_cell.position[1]}",
+                        tags=broadcast_tags,
+                    )))
+
+        if to_consultants:
+            scheduled_positions = frozenset(receivers)
+            review_tags = {**origin, "review_requested": "true"}
+            if consultants is None:
+                consultants = [c for c in grid.cells_by_role("sub") if c.agent_type == "consultant"]
+            for consultant in consultants:
+                if consultant.position in scheduled_positions:
+                    continue
+                if consultant.position == cell.position:
+                    continue
+                pending.append((consultant.position, replace(
+                    fragment,
+                    id=f"{fragment.id}->consult-{consultant.position[0]},{consultant.position[1]}",
+                    tags=review_tags,
+                )))
+
+        grid.schedule_propagations(pending)
 
     # Rework loop: critique FAIL/iterate forces feedback to original source
     if kind == "critique" and isinstance(content, dict):
@@ -597,32 +643,38 @@ def _propagate_output(
             _propagate_rework(cell, grid, content, tick_num)
 
 
-def _should_receive(neighbor: AgentCell, kind: str, source: AgentCell) -> bool:
-    """Determine if a neighbor should receive a particular kind of output.
-    This implements the local information barrier (Package 4)."""
+# Local information barrier (Package 4): kinds each neighbor accepts, keyed by
+# (role, agent_type). agent_type "" applies to every agent of that role.
+_ACCEPT: dict[tuple[str, str], frozenset[str]] = {
     # Masters receive critiques, artifacts, rework, and challenges for validation
-    if neighbor.role == "master" and kind in ("critique", "artifact", "code", "rework", "challenge"):
-        return True
+    ("master", ""): frozenset({"critique", "artifact", "code", "rework", "challenge"}),
     # Critique cells receive artifacts, layouts, work specs, and general output for review
-    if neighbor.role == "critique" and kind in ("artifact", "layout", "concept", "code", "work_spec", "output"):
-        return True
+    ("critique", ""): frozenset({"artifact", "layout", "concept", "code", "work_spec", "output"}),
     # Sub-agents receive work specs, research, and challenges
+    ("sub", ""): frozenset({"work_spec", "research", "brief_chunk", "challenge"}),
     # Consultant sub-agents also receive artifacts for domain-specific review
-    if neighbor.role == "sub" and kind in ("work_spec", "research", "brief_chunk", "challenge"):
-        return True
-    if neighbor.role == "sub" and neighbor.agent_type == "consultant" and kind in ("artifact", "code"):
-        return True
+    ("sub", "consultant"): frozenset({"artifact", "code"}),
     # Research cells receive briefs, work specs, and challenges
-    if neighbor.role == "research" and kind in ("brief_chunk", "work_spec", "challenge"):
-        return True
+    ("research", ""): frozenset({"brief_chunk", "work_spec", "challenge"}),
     # Execution cells receive concepts, layouts, iteration feedback, rework, enrichment,
     # research, challenges, and broadcast work_specs from distant masters
-    if neighbor.role == "execution" and kind in ("concept", "layout", "work_spec", "critique", "rework", "enrichment", "research", "challenge"):
-        return True
-    # Same domain sub-agents share freely
-    if neighbor.domain == source.domain and kind in ("concept", "layout", "research", "enrichment"):
-        return True
-    return False
+    ("execution", ""): frozenset({
+        "concept", "layout", "work_spec", "critique", "rework", "enrichment", "research", "challenge",
+    }),
+}
+# Same domain sub-agents share freely
+_SAME_DOMAIN_KINDS = frozenset({"concept", "layout", "research", "enrichment"})
+_NO_KINDS: frozenset[str] = frozenset()
+
+
+def _should_receive(neighbor: AgentCell, kind: str, source: AgentCell) -> bool:
+    """Determine if a neighbor should receive a particular kind of output.
+    This implements the local information barrier (Package 4); see _ACCEPT."""
+    return (
+        kind in _ACCEPT.get((neighbor.role, ""), _NO_KINDS)
+        or kind in _ACCEPT.get((neighbor.role, neighbor.agent_type), _NO_KINDS)
+        or (kind in _SAME_DOMAIN_KINDS and neighbor.domain == source.domain)
+    )
 
 
 def _propagate_rework(
@@ -662,17 +714,13 @@ def _propagate_rework(
         tags={"from_domain": cell.domain, "rework": "true"},
     )
 
-    for target_pos in source_positions:
-        grid.schedule_propagation(target_pos, WorkFragment(
+    grid.schedule_propagations([
+        (target_pos, replace(
+            rework_fragment,
             id=f"{rework_fragment.id}->{target_pos[0]},{target_pos[1]}",
-            kind=rework_fragment.kind,
-            content=rework_fragment.content,
-            source_cell=cell.position,
-            cost_of_delay=rework_fragment.cost_of_delay,
-            job_size=rework_fragment.job_size,
-            iteration=rework_fragment.iteration,
-            tags=dict(rework_fragment.tags),
         ))
+        for target_pos in source_positions
+    ])
 
 
 def _split_to_neighbor(cell: AgentCell, grid: AgentGrid, tick_num: int):
@@ -680,7 +728,7 @@ def _split_to_neighbor(cell: AgentCell, grid: AgentGrid, tick_num: int):
     if len(cell.inbox) <= 1:
         return
     neighbors = grid.neighbors(cell.position)
-    idle = [n for n in neighbors if n.state == AgentState.IDLE and not n.at_capacity]
+    idle = [n for n in neighbors if n.state is _IDLE and not n.at_capacity]
     if not idle:
         return
     # Give lowest-priority item to the first idle neighbor
@@ -689,7 +737,7 @@ def _split_to_neighbor(cell: AgentCell, grid: AgentGrid, tick_num: int):
     grid.schedule_propagation(target.position, item)
 
 
-def _pull_from_neighbor(cell: AgentCell, grid: AgentGrid):
+def _pull_from_neighbor(cell: AgentCell, grid: AgentGrid, tick_num: int):
     """Pull work from a busy neighbor."""
     neighbors = grid.neighbors(cell.position)
     busy = [n for n in neighbors if n.has_work and len(n.inbox) > 1]
@@ -724,6 +772,29 @@ def _escalate_to_neighbor(cell: AgentCell, grid: AgentGrid, tick_num: int):
         grid.schedule_propagation(targets[0].position, escalated)
 
 
+# Phase 3 dispatch. Neighbor actions move work between cells without an
+# invoke_fn call: SPLIT_BATCH shares work with an idle neighbor, PULL takes
+# work from a busy one, ESCALATE sends current work to a critique/master.
+_NEIGHBOR_ACTIONS: dict[Action, Callable[[AgentCell, AgentGrid, int], None]] = {
+    Action.SPLIT_BATCH: _split_to_neighbor,
+    Action.PULL: _pull_from_neighbor,
+    Action.ESCALATE: _escalate_to_neighbor,
+}
+
+# Actions queued as invoke_fn calls -> whether they consume the top inbox item.
+# PATCH patches an existing artifact with late-arriving enrichment; CHALLENGE
+# and GAP_ANALYSIS are Class 4 perturbations (a critique cell's "what's
+# missing?" challenge, gaps between brief and produced artifacts).
+_QUEUED_ACTIONS: dict[Action, bool] = {
+    Action.PROCESS: True,
+    Action.CRITIQUE: True,
+    Action.EMIT: True,
+    Action.PATCH: True,
+    Action.CHALLENGE: False,
+    Action.GAP_ANALYSIS: False,
+}
+
+
 def _print_tick(result: TickResult, grid: AgentGrid):
     """Print a compact tick summary."""
     active = [a for a in result.cell_actions if not a.get("skipped")]
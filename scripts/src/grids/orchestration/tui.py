@@ -15,7 +15,10 @@ from __future__ import annotations
 import json
 import threading
 import time
-from collections import deque
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from typing import Any, Callable
 
 from rich.console import Console, Group
@@ -23,7 +26,7 @@ from rich.layout import Layout
 from rich.live import Live
 from rich.panel import Panel
 from rich.table import Table
-from rich.text import Text
+from rich.text import Span, Text
 
 from grids.orchestration.grid import AgentGrid, AgentCell, CellOutput, WorkFragment
 from grids.orchestration.rules import AgentState, Action
@@ -41,15 +44,24 @@ STATE_CHARS = {
 
 MAX_STREAM_LINES = 80
 MAX_LINE_WIDTH = 90
+RENDER_INTERVAL = 0.1  # seconds; token-driven repaints are coalesced to ~10 fps
 
 
 class StreamBuffer:
-    """Thread-safe buffer for LLM token streaming."""
+    """Thread-safe buffer for LLM token streaming.
+
+    The in-progress line is kept as a styled prefix plus a list of tokens
+    and only turned into a Text when displayed. A stream has one producer,
+    so append_token just appends to that list (atomic under the GIL); the
+    lock guards starting, wrapping and ending lines and the finished lines.
+    """
 
     def __init__(self, max_lines: int = MAX_STREAM_LINES):
         self.max_lines = max_lines
         self.lines: deque[Text] = deque(maxlen=max_lines)
-        self._current_line: Text | None = None
+        self._current_prefix: tuple[str, str] = ("", "")  # (text, style)
+        self._current_tokens: list[str] | None = None
+        self._current_line_len: int = 0
         self._current_label: str = ""
         self._lock = threading.Lock()
 
@@ -57,27 +69,39 @@ class StreamBuffer:
         """Begin a new streaming line with a label."""
         with self._lock:
             self._current_label = label
-            self._current_line = Text()
-            self._current_line.append(f"[{label}] ", style=style or "bold")
+            self._current_prefix = (f"[{label}] ", style or "bold")
+            self._current_tokens = []
+            self._current_line_len = len(label) + 3
 
     def append_token(self, token: str):
         """Append a token to the current streaming line."""
-        with self._lock:
-            if self._current_line is None:
-                self._current_line = Text()
-            self._current_line.append(token)
-            # Wrap long lines
-            if len(self._current_line.plain) > MAX_LINE_WIDTH:
-                self.lines.append(self._current_line)
-                self._current_line = Text()
-                self._current_line.append("  ", style="dim")
+        tokens = self._current_tokens
+        if tokens is None:
+            with self._lock:
+                if self._current_tokens is None:
+                    self._current_prefix = ("", "")
+                    self._current_tokens = []
+                    self._current_line_len = 0
+                tokens = self._current_tokens
+        tokens.append(token)
+        self._current_line_len += len(token)
+        # Wrap long lines
+        if self._current_line_len > MAX_LINE_WIDTH:
+            with self._lock:
+                self.lines.append(_line_text(self._current_prefix, tokens))
+                self._current_prefix = ("  ", "dim")
+                self._current_tokens = []
+                self._current_line_len = 2
 
     def end_stream(self):
         """Finalize the current streaming line."""
         with self._lock:
-            if self._current_line is not None and len(self._current_line.plain) > 0:
-                self.lines.append(self._current_line)
-            self._current_line = None
+            tokens = self._current_tokens
+            if tokens is not None and self._current_line_len > 0:
+                self.lines.append(_line_text(self._current_prefix, tokens))
+            self._current_prefix = ("", "")
+            self._current_tokens = None
+            self._current_line_len = 0
             self._current_label = ""
 
     def add_event(self, text: str, style: str = ""):
@@ -86,13 +110,30 @@ class StreamBuffer:
             line = Text(text, style=style)
             self.lines.append(line)
 
-    def get_display(self) -> list[Text]:
-        """Get current lines for display."""
+    def get_display(self, tail: int | None = None) -> list[Text]:
+        """Get current lines for display (only the last `tail`, if given)."""
         with self._lock:
-            result = list(self.lines)
-            if self._current_line is not None and len(self._current_line.plain) > 0:
-                result.append(self._current_line)
-            return result
+            prefix = self._current_prefix
+            tokens = self._current_tokens
+            if tokens is not None:
+                tokens = list(tokens) if self._current_line_len > 0 else None
+            if tail is None:
+                result = list(self.lines)
+            else:
+                keep = max(tail - (tokens is not None), 0)
+                result = list(islice(reversed(self.lines), keep))
+                result.reverse()
+        if tokens is not None:
+            result.append(_line_text(prefix, tokens))
+        return result
+
+
+def _line_text(prefix: tuple[str, str], tokens: list[str]) -> Text:
+    """Text for a streaming line: the styled prefix, then the raw tokens."""
+    line = Text()
+    line.append(prefix[0], style=prefix[1])
+    line.append("".join(tokens))
+    return line
 
 
 class GridTUI:
@@ -107,6 +148,25 @@ class GridTUI:
         self.total_ticks = 0
         self.start_time = time.time()
         self._live: Live | None = None
+        self._render_interval = RENDER_INTERVAL
+        self._last_render_ts = 0.0
+        # Background repaint (see start_render_thread)
+        self._render_thread: threading.Thread | None = None
+        self._render_requested = threading.Event()
+        self._render_stop = threading.Event()
+        # Frames that raised while painting, and the last such error
+        self.render_error_count = 0
+        self.last_render_error: Exception | None = None
+        # Panels are reused until what they show changes (see _grid_fingerprint)
+        self._grid_panel_cache: tuple[tuple, Panel] | None = None
+        self._metrics_panel_cache: tuple[tuple, Panel] | None = None
+        # Cells per domain only change when cells are placed
+        self._domain_counts: Counter[str] = Counter(c.domain for c in grid.cells.values())
+        self._domain_counts_size = len(grid.cells)
+        # (state, domain, inbox count capped at 9) -> _cell_char_style result
+        self._cell_styles: dict[tuple[AgentState, str, int], tuple[str, str]] = {}
+        # Built once; render() only swaps the panels inside it
+        self._layout = self.make_layout()
 
     def make_layout(self) -> Layout:
         layout = Layout()
@@ -120,45 +180,78 @@ class GridTUI:
         )
         return layout
 
-    def render_grid_panel(self) -> Panel:
+    def _grid_fingerprint(self) -> tuple:
+        """Everything about the cells that the grid and metrics panels show.
+
+        Streaming re-renders many times between state changes; both panels
+        are cached against this."""
+        return tuple((c.state, min(len(c.inbox), 9)) for c in self.grid.cells.values())
+
+    def render_grid_panel(self, fingerprint: tuple | None = None) -> Panel:
         """Render the CA grid as a colored Rich panel."""
-        grid_text = Text()
+        if fingerprint is None:
+            fingerprint = self._grid_fingerprint()
+        cached = self._grid_panel_cache
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+
+        # (text, style) parts, assembled into one Text at the end
+        parts: list[tuple[str, str]] = []
 
         # Header row with column numbers
-        grid_text.append("   ", style="dim")
+        parts.append(("   ", "dim"))
         for x in range(self.grid.width):
-            grid_text.append(f"{x}", style="dim")
-        grid_text.append("\n")
+            parts.append((f"{x}", "dim"))
+        parts.append(("\n", ""))
 
+        cell_styles = self._cell_styles
         for y in range(self.grid.height):
-            grid_text.append(f"{y:2d} ", style="dim")
+            parts.append((f"{y:2d} ", "dim"))
             for x in range(self.grid.width):
                 cell = self.grid.get((x, y))
                 if cell is None:
-                    grid_text.append(" ", style="dim")
-                else:
-                    ch, style = _cell_char_style(cell, self.domain_colors)
-                    grid_text.append(ch, style=style)
-            grid_text.append("\n")
+                    parts.append((" ", "dim"))
+                    continue
+                key = (cell.state, cell.domain, min(len(cell.inbox), 9))
+                char_style = cell_styles.get(key)
+                if char_style is None:
+                    char_style = cell_styles[key] = _cell_char_style(cell, self.domain_colors)
+                parts.append(char_style)
+            parts.append(("\n", ""))
 
         # Legend
-        grid_text.append("\n", style="dim")
+        if self._domain_counts_size != len(self.grid.cells):
+            self._domain_counts = Counter(c.domain for c in self.grid.cells.values())
+            self._domain_counts_size = len(self.grid.cells)
+        parts.append(("\n", "dim"))
         for domain, color in self.domain_colors.items():
-            cells = self.grid.cells_by_domain(domain)
-            if cells:
-                grid_text.append(f"  {domain}", style=color)
-                grid_text.append(f" ({len(cells)})", style="dim")
-                grid_text.append("  ")
-        grid_text.append("\n")
-        grid_text.append("  . idle  W working  C critiquing  ~ waiting  X blocked", style="dim")
+            count = self._domain_counts[domain]
+            if count:
+                parts.append((f"  {domain}", color))
+                parts.append((f" ({count})", "dim"))
+                parts.append(("  ", ""))
+        parts.append(("\n", ""))
+        parts.append(("  . idle  W working  C critiquing  ~ waiting  X blocked", "dim"))
+
+        grid_text = _styled_text(parts)
 
-        return Panel(grid_text, title=f"Grid {self.grid.width}x{self.grid.height}", border_style="cyan")
+        panel = Panel(grid_text, title=f"Grid {self.grid.width}x{self.grid.height}", border_style="cyan")
+        self._grid_panel_cache = (fingerprint, panel)
+        return panel
 
-    def render_metrics_panel(self) -> Panel:
+    def render_metrics_panel(self, fingerprint: tuple | None = None) -> Panel:
         """Render tick metrics."""
         elapsed = time.time() - self.start_time
         t = self.last_tick
 
+        if fingerprint is None:
+            fingerprint = self._grid_fingerprint()
+        # Elapsed is shown in whole seconds
+        key = (fingerprint, self.total_ticks, self.total_llm_calls, id(t), int(elapsed))
+        cached = self._metrics_panel_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
         metrics = Text()
         metrics.append(f"Tick: {self.total_ticks}", style="bold cyan")
         metrics.append(f"  LLM calls: {self.total_llm_calls}", style="bold")
@@ -170,34 +263,90 @@ class GridTUI:
             metrics.append(f"emitted={t.items_emitted} ", style="yellow" if t.items_emitted > 0 else "dim")
             metrics.append(f"propagated={t.propagations}\n", style="blue" if t.propagations > 0 else "dim")
 
-        # State distribution
+        # State distribution, counted from the fingerprint in one pass
+        state_counts = Counter(state for state, _ in fingerprint)
         for state in AgentState:
-            count = len(self.grid.cells_by_state(state))
+            count = state_counts[state]
             if count > 0:
                 metrics.append(f"  {state.value}: {count}", style="bold" if state == AgentState.WORKING else "dim")
                 metrics.append("  ")
 
-        quiescent = self.grid.is_quiescent()
+        quiescent = all(state == AgentState.IDLE and not inbox for state, inbox in fingerprint)
         if quiescent:
             metrics.append("\n  QUIESCENT", style="bold green")
 
-        return Panel(metrics, title="Metrics", border_style="dim")
+        panel = Panel(metrics, title="Metrics", border_style="dim")
+        self._metrics_panel_cache = (key, panel)
+        return panel
 
     def render_stream_panel(self) -> Panel:
         """Render the LLM output stream."""
-        lines = self.stream.get_display()
         # Show last N lines that fit
-        display_lines = lines[-40:]
+        display_lines = self.stream.get_display(tail=40)
         content = Group(*display_lines) if display_lines else Text("Waiting for first tick...", style="dim")
         return Panel(content, title="Agent Stream", border_style="yellow")
 
     def render(self) -> Layout:
-        layout = self.make_layout()
-        layout["grid_view"].update(self.render_grid_panel())
-        layout["metrics"].update(self.render_metrics_panel())
+        layout = self._layout
+        fingerprint = self._grid_fingerprint()
+        layout["grid_view"].update(self.render_grid_panel(fingerprint))
+        layout["metrics"].update(self.render_metrics_panel(fingerprint))
         layout["stream"].update(self.render_stream_panel())
         return layout
 
+    def start_render_thread(self, live: Live):
+        """Repaint `live` from a daemon thread instead of the caller's.
+
+        _maybe_render then only flags a repaint, so LLM streaming loops
+        keep reading tokens while Rich renders."""
+        self._live = live
+        self._render_stop.clear()
+        self._render_thread = threading.Thread(
+            target=self._render_loop, name="grid-tui-render", daemon=True,
+        )
+        self._render_thread.start()
+
+    def stop_render_thread(self):
+        """Stop the render thread, paint a final frame and detach the display."""
+        if self._render_thread is not None:
+            self._render_stop.set()
+            self._render_thread.join()
+            self._render_thread = None
+        if self._live is not None:
+            self._paint()
+        self._live = None
+
+    def _render_loop(self):
+        # Wake once per render interval and repaint if anything asked for it
+        while not self._render_stop.wait(self._render_interval):
+            if self._render_requested.is_set():
+                self._render_requested.clear()
+                self._paint()
+
+    def _paint(self):
+        """Repaint from the render thread. A frame that fails to render is
+        counted and noted in the stream rather than killing the thread
+        (run_with_tui reports the count once the display is gone)."""
+        try:
+            self._live.update(self.render())
+        except Exception as e:
+            self.render_error_count += 1
+            self.last_render_error = e
+            self.stream.add_event(f"[render error] {e!r}", style="bold red")
+
+    def _maybe_render(self, force: bool = False):
+        """Repaint the live display, at most once per render interval unless forced."""
+        if self._live is None:
+            return
+        if self._render_thread is not None:
+            self._render_requested.set()
+            return
+        now = time.monotonic()
+        if not force and now - self._last_render_ts < self._render_interval:
+            return
+        self._last_render_ts = now
+        self._live.update(self.render())
+
     def on_tick(self, result: TickResult):
         """Callback for each tick completion."""
         self.last_tick = result
@@ -252,14 +401,12 @@ class GridTUI:
                 for i in range(0, min(len(result_str), 400), chunk_size):
                     chunk = result_str[i:i + chunk_size]
                     tui.stream.append_token(chunk)
-                    if tui._live:
-                        tui._live.update(tui.render())
+                    tui._maybe_render()
                 if len(result_str) > 400:
                     tui.stream.append_token("...")
 
             tui.stream.end_stream()
-            if tui._live:
-                tui._live.update(tui.render())
+            tui._maybe_render(force=True)
 
             return result
 
@@ -312,14 +459,14 @@ class GridTUI:
                     if token:
                         collected.append(token)
                         tui.stream.append_token(token)
-                        if tui._live:
-                            tui._live.update(tui.render())
+                        tui._maybe_render()
             except Exception as e:
                 tui.stream.append_token(f" [ERROR: {e}]")
                 tui.stream.end_stream()
                 return None
 
             tui.stream.end_stream()
+            tui._maybe_render(force=True)
 
             full_text = "".join(collected)
             return _parse_json_or_text(full_text)
@@ -330,20 +477,20 @@ class GridTUI:
 def _build_messages(cell: AgentCell, action: Action, work: WorkFragment | None, neighbors: list[CellOutput]):
     """Build LLM messages for any cell type. Mirrors invoke.py logic but returns messages."""
     from grids.orchestration.invoke import (
-        _get_cell_context, _neighbor_summary, _content_str,
-        _master_system_prompt,
+        _neighbor_summary, _content_str, _master_system_prompt,
     )
     from langchain_core.messages import HumanMessage, SystemMessage
 
     content = _content_str(work.content) if work else ""
     neighbor_ctx = _neighbor_summary(neighbors)
-    context = _get_cell_context(cell, content[:300]) if cell.knowledge_collections else ""
+    context = _cell_context(cell, content[:300]) if cell.knowledge_collections else ""
 
     if cell.role == "master":
         if action == Action.PROCESS:
             return [
-                SystemMessage(content=_master_system_prompt(cell, context)),
+                SystemMessage(content=_master_system_prompt(cell)),
                 HumanMessage(content=(
+                    f"Domain knowledge:\n{context}\n\n"
                     f"Decompose this into a structured work specification with concrete, "
                     f"buildable components. Your domain is: {cell.domain}.\n\n"
                     f"Input:\n{content}\n\n"
@@ -352,8 +499,9 @@ def _build_messages(cell: AgentCell, action: Action, work: WorkFragment | None,
             ]
         elif action == Action.CRITIQUE:
             return [
-                SystemMessage(content=_master_system_prompt(cell, context)),
+                SystemMessage(content=_master_system_prompt(cell)),
                 HumanMessage(content=(
+                    f"Domain knowledge:\n{context}\n\n"
                     f"Validate this work product from your domain perspective ({cell.domain}).\n\n"
                     f"Work product:\n{content}\n\nNeighbor context:\n{neighbor_ctx}\n\n"
                     f"Score 0.0-1.0. JSON: {{\"score\": N, \"verdict\": \"approve\"|\"iterate\", \"feedback\": \"...\"}}"
@@ -363,15 +511,7 @@ def _build_messages(cell: AgentCell, action: Action, work: WorkFragment | None,
     elif cell.role == "research":
         # Research: retrieve from knowledge store + synthesize
         query = content[:500]
-        findings_parts = []
-        for coll in cell.knowledge_collections[:4]:
-            try:
-                hits = query_store(query, coll, n_results=3)
-                for hit in hits:
-                    findings_parts.append(f"[{coll}] {hit['text'][:300]}")
-            except Exception:
-                continue
-        findings_text = "\n---\n".join(findings_parts[:6])
+        findings_text = _research_findings(tuple(cell.knowledge_collections[:4]), query)
         return [
             SystemMessage(content=(
                 f"You are a research agent for {cell.domain}. "
@@ -411,9 +551,10 @@ def _build_messages(cell: AgentCell, action: Action, work: WorkFragment | None,
             return [
                 SystemMessage(content=(
                     f"You are the {cell.agent_type} specialist in {cell.domain}. "
-                    f"Strictness: {cell.strictness}.\n\nDomain knowledge:\n{context}"
+                    f"Strictness: {cell.strictness}."
                 )),
                 HumanMessage(content=(
+                    f"Domain knowledge:\n{context}\n\n"
                     f"Review from your {cell.agent_type} perspective:\n{content}\n"
                     f"Neighbors:\n{neighbor_ctx}\n\n"
                     f"JSON: {{\"score\": N, \"verdict\": \"pass\"|\"fail\", \"feedback\": \"...\"}}"
@@ -422,10 +563,10 @@ def _build_messages(cell: AgentCell, action: Action, work: WorkFragment | None,
         else:
             return [
                 SystemMessage(content=(
-                    f"You are the {cell.agent_type} specialist in {cell.domain}.\n"
-                    f"Domain knowledge:\n{context}"
+                    f"You are the {cell.agent_type} specialist in {cell.domain}."
                 )),
                 HumanMessage(content=(
+                    f"Domain knowledge:\n{context}\n\n"
                     f"Apply your {cell.agent_type} expertise:\n{content}\n"
                     f"Neighbors:\n{neighbor_ctx}\n\n"
                     f"Contribute specific improvements from your specialist perspective."
@@ -435,10 +576,63 @@ def _build_messages(cell: AgentCell, action: Action, work: WorkFragment | None,
     return None
 
 
+# Knowledge lookups depend only on the collections and the query text, and
+# the same work comes back to a cell across iterations and critique loops.
+def _cell_context(cell: AgentCell, query: str) -> str:
+    """_get_cell_context, cached by (collections, query)."""
+    return _knowledge_context(tuple(cell.knowledge_collections[:4]), query)
+
+
+@lru_cache(maxsize=256)
+def _knowledge_context(collections: tuple[str, ...], query: str) -> str:
+    from grids.orchestration.invoke import _collections_context
+
+    return _collections_context(collections, query)
+
+
+@lru_cache(maxsize=256)
+def _research_findings(collections: tuple[str, ...], query: str) -> str:
+    """Knowledge fragments for a research cell's task.
+
+    Collections are queried concurrently; fragments keep collection order."""
+    from grids.knowledge.store import query_store
+
+    def fetch(coll: str) -> list[str]:
+        try:
+            hits = query_store(query, coll, n_results=3)
+            return [f"[{coll}] {hit['text'][:300]}" for hit in hits]
+        except Exception:
+            return []
+
+    if len(collections) <= 1:
+        per_coll = [fetch(coll) for coll in collections]
+    else:
+        with ThreadPoolExecutor(max_workers=len(collections),
+                                thread_name_prefix="grids-knowledge") as pool:
+            futures = [pool.submit(fetch, coll) for coll in collections]
+            per_coll = [f.result() for f in futures]
+    findings_parts = [part for parts in per_coll for part in parts]
+    return "\n---\n".join(findings_parts[:6])
+
+
 def _temp_for_role(role: str) -> float:
     return {"master": 0.4, "research": 0.3, "critique": 0.2, "execution": 0.4}.get(role, 0.5)
 
 
+def _styled_text(parts: list[tuple[str, str]]) -> Text:
+    """Build one Text from (text, style) parts in a single pass.
+
+    Cheaper than a Text.append per part when rendering every cell."""
+    spans: list[Span] = []
+    offset = 0
+    for text, style in parts:
+        end = offset + len(text)
+        if style:
+            spans.append(Span(offset, end, style))
+        offset = end
+    return Text("".join(text for text, _ in parts), spans=spans)
+
+
 def _cell_char_style(cell: AgentCell, domain_colors: dict[str, str] | None = None) -> tuple[str, str]:
     """Get display character and Rich style for a cell."""
     domain_color = (domain_colors or {}).get(cell.domain) or rich_color(cell.domain)
@@ -499,29 +693,28 @@ def run_with_tui(
             hold = max(0.5, result.elapsed_seconds * 0.3)
             recorder.write_hold(seconds=hold)
         if stream_logger:
-            stream_logger.log("tick",
-                              tick=result.tick,
-                              actions=result.actions_taken,
-                              llm_calls=result.llm_calls,
-                              emitted=result.items_emitted,
-                              elapsed=round(result.elapsed_seconds, 3),
-                              routing_scheduled=result.propagations + result.rejected,
-                              routing_delivered=result.propagations,
-                              routing_rejected=result.rejected)
-
-    with Live(tui.render(), console=console, refresh_per_second=4, screen=True) as live:
-        tui._live = live
-
-        result = run(
-            grid,
-            invoke_fn,
-            max_ticks=max_ticks,
-            quiescence_ticks=quiescence_ticks,
-            verbose=False,
-            on_tick=lambda r: (on_tick_combined(r), live.update(tui.render())),
-        )
+            stream_logger.log_tick(result)
 
-        tui._live = None
+    try:
+        with Live(tui.render(), console=console, refresh_per_second=4, screen=True) as live:
+            tui.start_render_thread(live)
+            try:
+                result = run(
+                    grid,
+                    invoke_fn,
+                    max_ticks=max_ticks,
+                    quiescence_ticks=quiescence_ticks,
+                    verbose=False,
+                    on_tick=lambda r: (on_tick_combined(r), tui._maybe_render(force=True)),
+                )
+            finally:
+                tui.stop_render_thread()
+    finally:
+        if tui.render_error_count:
+            Console(stderr=True).print(
+                f"[yellow]TUI: {tui.render_error_count} frame(s) failed to render; "
+                f"last error: {tui.last_render_error!r}[/yellow]"
+            )
 
     if recorder:
         # Final frame hold
@@ -588,24 +781,24 @@ def _make_recorded_streaming_invoke(tui: GridTUI, recorder, stream_logger=None):
                     tui.stream.append_token(token)
 
                     # Update TUI
-                    if tui._live and token_count % 3 == 0:
-                        tui._live.update(tui.render())
+                    tui._maybe_render()
 
-                    # Write video frame every ~20 tokens
+                    # Queue a video line every ~20 tokens; frames are
+                    # written at the end of the call and on each tick
                     if recorder and token_count % 20 == 0:
-                        recorder.add_stream_event(
+                        recorder.queue_stream_event(
                             f"  {label}: {''.join(collected[-40:])[:80]}",
                             domain=domain,
                         )
-                        recorder.write_frame()
         except Exception as e:
             tui.stream.append_token(f" [ERROR: {e}]")
             tui.stream.end_stream()
+            if recorder:
+                recorder.flush_frames()
             return None
 
         tui.stream.end_stream()
-        if tui._live:
-            tui._live.update(tui.render())
+        tui._maybe_render(force=True)
 
         full_text = "".join(collected)
 
@@ -618,6 +811,7 @@ def _make_recorded_streaming_invoke(tui: GridTUI, recorder, stream_logger=None):
             stream_logger.log("llm_end",
                               domain=domain, agent=agent,
                               action=action.value,
+                              pos=f"{cell.position[0]},{cell.position[1]}",
                               token_count=token_count,
                               response=full_text[:2000])
 
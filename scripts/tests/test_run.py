@@ -0,0 +1,55 @@
+"""Tests for grids.orchestration.run helpers."""
+
+import math
+
+from grids.orchestration.run import (
+    _preview, _read_json, _shard_rework_items, _write_shard_code_artifacts,
+)
+from grids.orchestration.tick import RunResult
+
+
+def test_read_json_accepts_nan_and_infinity(tmp_path):
+    path = tmp_path / "spec.json"
+    path.write_text('{"score": NaN, "limit": Infinity, "name": "x"}', encoding="utf-8")
+
+    data = _read_json(str(path))
+
+    assert math.isnan(data["score"])
+    assert data["limit"] == math.inf
+    assert data["name"] == "x"
+
+
+def _code_result(files: dict[str, str]) -> RunResult:
+    artifact = {"files": [{"path": path, "content": text} for path, text in files.items()]}
+    return RunResult(total_ticks=1, total_llm_calls=1, total_items_emitted=1,
+                     artifacts=[{"source": "eng/coder", "content": artifact}])
+
+
+def test_rework_shards_do_not_overwrite_each_others_files(tmp_path):
+    items = [
+        {"kind": "validation_error", "category": "typescript", "file": "src/a.ts"},
+        {"kind": "validation_error", "category": "typescript", "file": "src/b.ts"},
+    ]
+    shards = _shard_rework_items(items, 2)
+    assert len(shards) == 2
+    first, second = (0, 1) if shards[0][0]["file"] == "src/a.ts" else (1, 0)
+
+    # Both shards rewrite both files (and one file nobody was asked to fix)
+    results = [None, None]
+    results[first] = _code_result({"src/a.ts": "a fixed", "src/b.ts": "b stale", "src/c.ts": "c first"})
+    results[second] = _code_result({"src/a.ts": "a stale", "src/b.ts": "b fixed", "src/c.ts": "c second"})
+
+    app_dir = tmp_path / "app"
+    _write_shard_code_artifacts(str(tmp_path), results, shards, {"output_dir": str(app_dir)})
+
+    assert (app_dir / "src/a.ts").read_text() == "a fixed"
+    assert (app_dir / "src/b.ts").read_text() == "b fixed"
+    assert (app_dir / "src/c.ts").read_text() == ("c first" if first == 0 else "c second")
+
+
+def test_preview_falls_back_to_str_for_unencodable_containers():
+    looped: list = []
+    looped.append(looped)
+
+    assert _preview({(1, 2): "x"}, 50) == "{(1, 2): 'x'}"
+    assert _preview(looped, 20) == "[[...]]"
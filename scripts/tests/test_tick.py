@@ -0,0 +1,81 @@
+"""Tests for the tick engine."""
+
+import random
+
+import pytest
+
+from grids.orchestration import rules
+from grids.orchestration.grid import AgentCell, AgentGrid, Neighborhood, WorkFragment
+from grids.orchestration.rules import Action
+from grids.orchestration.tick import run
+
+ROLE_TABLES = [
+    ("research", rules.research_rules),
+    ("sub", rules.concept_rules),
+    ("sub", rules.layout_rules),
+    ("critique", rules.critique_rules),
+    ("master", rules.master_rules),
+    ("execution", rules.execution_rules),
+]
+
+
+def _random_grid(seed: int) -> AgentGrid:
+    rnd = random.Random(seed)
+    grid = AgentGrid(5, 4, rnd.choice([Neighborhood.MOORE, Neighborhood.VON_NEUMANN]))
+    for x in range(5):
+        for y in range(4):
+            if rnd.random() < 0.15:
+                continue
+            role, table = rnd.choice(ROLE_TABLES)
+            grid.place(AgentCell(
+                position=(x, y),
+                domain=rnd.choice(["a", "b", "c"]),
+                agent_type=rnd.choice(["consultant", "typography", "coder", "tester", "master"]),
+                role=role,
+                rule_table=table(),
+            ))
+    for i in range(rnd.randint(3, 12)):
+        grid.inject(rnd.choice(list(grid.cells)), WorkFragment(
+            id=f"s{i}",
+            kind=rnd.choice(["brief_chunk", "work_spec", "research", "artifact", "concept"]),
+            content={"i": i},
+            cost_of_delay=rnd.random() + 0.5,
+        ))
+    return grid
+
+
+def _invoke_fn(seed: int):
+    """Deterministic per call, whatever order or thread it runs on."""
+    def invoke(cell, action, work, neighbors):
+        rnd = random.Random(f"{seed}-{cell.position}-{action.value}-{work.id if work else None}")
+        if rnd.random() < 0.15:
+            return None
+        if action == Action.CRITIQUE:
+            return {"score": rnd.choice([40, 80, 90]), "verdict": rnd.choice(["pass", "fail", "iterate"])}
+        return {"out": rnd.random()}
+    return invoke
+
+
+def _summary(result, grid: AgentGrid):
+    return {
+        "ticks": [
+            (t.actions_taken, t.llm_calls, t.items_emitted, t.propagations, t.rejected,
+             t.cell_actions, t.routing_records, t.critique_scores, t.critique_verdicts, t.rework_count)
+            for t in result.tick_history
+        ],
+        "artifacts": result.artifacts,
+        "cells": {
+            pos: (cell.state, [f.id for f in cell.inbox], cell.output.kind, cell.output.tick)
+            for pos, cell in grid.cells.items()
+        },
+    }
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_concurrent_invoke_matches_sequential(seed):
+    """max_workers > 1 must deliver, reject and order work exactly like max_workers=1."""
+    seq_grid, par_grid = _random_grid(seed), _random_grid(seed)
+    sequential = run(seq_grid, _invoke_fn(seed), max_ticks=25, verbose=False, max_workers=1)
+    concurrent = run(par_grid, _invoke_fn(seed), max_ticks=25, verbose=False, max_workers=4)
+
+    assert _summary(concurrent, par_grid) == _summary(sequential, seq_grid)